@@ -0,0 +1,150 @@
+# Aggregates behind the Analytics page.
+#
+# Curriculum charts sum the catalog's subject weights with pandas group-bys,
+# as a share of each branch's total, so they always match the branch pages.
+# Cohort charts take one row per student
+# and subject (possibly hundreds of thousands of rows), aggregate on the
+# server and send only summaries and a bounded, stratified sample of points.
+#
+# pandas and NumPy are imported at module level: only the Analytics page
+# (views/analytics_dashboard.py) imports this module, so other pages never
+# load them.
+
+import numpy as np
+import pandas as pd
+
+COHORT_COLUMNS = ["student_id", "branch", "semester", "subject", "study_hours", "score"]
+
+# Most points a cohort scatter plot sends to the browser
+MAX_SCATTER_POINTS = 20000
+
+
+def curriculum_frame(catalog):
+    """
+    One row per (branch, stage, semester, subject) of the catalog
+    """
+    rows = [
+        (code, position, stage["tab"].split(" (")[0], semester, subject, weight)
+        for code, stages in catalog["by_branch"].items()
+        for position, stage in enumerate(stages)
+        for semester, subjects in stage["semesters"].items()
+        for subject, weight in subjects.items()
+    ]
+    return pd.DataFrame(rows, columns=["branch", "stage", "stage_label", "semester", "subject", "weight"])
+
+
+def curriculum_aggregates(catalog):
+    """
+    The three Analytics charts' data, as plain lists and dicts
+    """
+    df = curriculum_frame(catalog)
+    branches = list(catalog["by_branch"])
+
+    # Each subject's weight as a percentage of its branch's total weight
+    df["share"] = 100 * df["weight"] / df.groupby("branch")["weight"].transform("sum")
+
+    # Branch x stage share; stages line up by position across branches and
+    # take the first word of their label ("Core CS", "Core IT" -> "Core")
+    by_stage = (df.groupby(["branch", "stage"])["share"].sum()
+                .unstack("stage", fill_value=0).reindex(branches).round(1))
+    stage_names = df.drop_duplicates("stage").set_index("stage")["stage_label"].str.split().str[0]
+
+    progression = (df.groupby(["semester", "branch"])["share"].sum()
+                   .unstack("branch", fill_value=0).reindex(columns=branches).round(1))
+
+    distributions = {
+        code: group.groupby("stage_label", sort=False)["share"].sum().round(1).to_dict()
+        for code, group in df.groupby("branch", sort=False)
+    }
+
+    return {
+        "branches": branches,
+        "stages": {stage_names[stage]: by_stage[stage].tolist() for stage in by_stage.columns},
+        "distributions": distributions,
+        "semesters": progression.index.tolist(),
+        "progressions": {code: progression[code].tolist() for code in branches},
+    }
+
+
+def sample_cohort(catalog, students=2000, seed=0):
+    """
+    A synthetic cohort: every student takes every subject of their branch
+
+    Scores rise with study hours and fall with subject weight, plus noise.
+    """
+    rng = np.random.default_rng(seed)
+    subjects = curriculum_frame(catalog)[["branch", "semester", "subject", "weight"]]
+    codes = subjects["branch"].unique()
+
+    student_branch = rng.choice(codes, size=students)
+    roster = pd.DataFrame({"student_id": np.arange(students), "branch": student_branch})
+    df = roster.merge(subjects, on="branch")
+
+    ability = rng.normal(0, 8, size=students)[df["student_id"].to_numpy()]
+    df["study_hours"] = rng.gamma(4.0, 2.5, size=len(df)).round(1)
+    df["score"] = np.clip(
+        40 + 9 * np.sqrt(df["study_hours"]) - 0.8 * df["weight"] + ability + rng.normal(0, 6, size=len(df)),
+        0, 100,
+    ).round(1)
+    return df[COHORT_COLUMNS]
+
+
+def validate_cohort(df):
+    """
+    Return the cohort with typed columns; raises ValueError on missing columns
+    """
+    missing = [column for column in COHORT_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+    df = df[COHORT_COLUMNS].copy()
+    df["branch"] = df["branch"].astype("category")
+    df["subject"] = df["subject"].astype("category")
+    df["semester"] = pd.to_numeric(df["semester"], errors="coerce")
+    df["study_hours"] = pd.to_numeric(df["study_hours"], errors="coerce")
+    df["score"] = pd.to_numeric(df["score"], errors="coerce")
+    return df.dropna(subset=["semester", "study_hours", "score"])
+
+
+def cohort_summary(df):
+    """
+    Students, rows and mean score per branch
+    """
+    summary = df.groupby("branch", observed=True).agg(
+        students=("student_id", "nunique"),
+        records=("score", "size"),
+        mean_score=("score", "mean"),
+    )
+    return summary.round(1).reset_index()
+
+
+def semester_scores(df):
+    """
+    Score quartiles per branch and semester, for a line with a band
+    """
+    quartiles = (df.groupby(["branch", "semester"], observed=True)["score"]
+                 .quantile([0.25, 0.5, 0.75])
+                 .unstack())
+    quartiles.columns = ["q1", "median", "q3"]
+    return quartiles.reset_index()
+
+
+def score_histogram(df, bins=40):
+    """
+    Score counts per branch over shared bins, computed with NumPy
+    """
+    edges = np.linspace(0, 100, bins + 1)
+    counts = {
+        code: np.histogram(group["score"].to_numpy(), bins=edges)[0].tolist()
+        for code, group in df.groupby("branch", observed=True)
+    }
+    return ((edges[:-1] + edges[1:]) / 2).tolist(), counts
+
+
+def downsample(df, max_points=MAX_SCATTER_POINTS, seed=0):
+    """
+    At most max_points rows, sampled evenly from each branch
+    """
+    if len(df) <= max_points:
+        return df
+    fraction = max_points / len(df)
+    return df.groupby("branch", observed=True, group_keys=False).sample(frac=fraction, random_state=seed)
@@ -0,0 +1,153 @@
+# Contact form storage: a write-behind queue in front of a SQLite database.
+#
+# submit() only puts the message on an in-memory queue, so the Streamlit rerun
+# never waits on disk. A background thread drains the queue and inserts the
+# messages in batches, retrying any batch that fails (see sqlite_writer.py).
+# Support staff can read them back with:
+#
+#   python contact_store.py --subject "Technical Support" --limit 20
+
+import argparse
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import sqlite_writer
+
+CONTACT_DB = os.environ.get("ROADMAP_CONTACT_DB", "contact.db")
+
+# Identical messages within this many seconds are stored once
+DEDUP_SECONDS = 600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contact_messages (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    dedup_window INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS contact_messages_dedup
+    ON contact_messages (digest, dedup_window);
+CREATE INDEX IF NOT EXISTS contact_messages_created
+    ON contact_messages (created_at);
+CREATE INDEX IF NOT EXISTS contact_messages_subject
+    ON contact_messages (subject, created_at);
+CREATE INDEX IF NOT EXISTS contact_messages_email
+    ON contact_messages (email, created_at);
+CREATE VIEW IF NOT EXISTS inbox AS
+    SELECT id,
+           datetime(created_at, 'unixepoch') AS received,
+           subject, name, email, message
+    FROM contact_messages;
+"""
+
+
+def connect(path):
+    return sqlite_writer.connect(path, SCHEMA)
+
+
+def message_digest(name, email, subject, message):
+    """
+    Hash of the normalized fields, used to spot double submits
+    """
+    fields = [name.strip(), email.strip().lower(), subject.strip(), " ".join(message.split())]
+    return hashlib.sha256("\x1f".join(fields).encode("utf-8")).hexdigest()
+
+
+class ContactStore:
+    def __init__(self, path=CONTACT_DB, batch_size=100, flush_interval=0.5):
+        self.path = path
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+        self._writer = sqlite_writer.BatchWriter(path, SCHEMA, self._insert, "contact-writer",
+                                                 batch_size, flush_interval)
+
+    def submit(self, name, email, subject, message):
+        """
+        Queue a message for storage; returns False for a recent duplicate
+        """
+        now = time.time()
+        digest = message_digest(name, email, subject, message)
+
+        with self._recent_lock:
+            # Forget digests older than the dedup window; oldest come first
+            while self._recent and now - next(iter(self._recent.values())) > DEDUP_SECONDS:
+                self._recent.popitem(last=False)
+            if digest in self._recent:
+                return False
+            self._recent[digest] = now
+
+        self._writer.put((now, name.strip(), email.strip(), subject, message.strip(), digest,
+                          int(now // DEDUP_SECONDS)))
+        return True
+
+    @property
+    def healthy(self):
+        """
+        False while queued messages are failing to reach the database
+        """
+        return self._writer.healthy
+
+    def _insert(self, conn, batch):
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO contact_messages "
+                "(created_at, name, email, subject, message, digest, dedup_window) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+
+    def close(self):
+        """
+        Flush queued messages and stop the writer thread
+        """
+        self._writer.close()
+
+
+def query_inbox(path=CONTACT_DB, subject=None, email=None, limit=50):
+    """
+    Newest messages first, optionally filtered by subject and/or email
+    """
+    clauses = []
+    params = []
+    if subject:
+        clauses.append("subject = ?")
+        params.append(subject)
+    if email:
+        clauses.append("email = ?")
+        params.append(email.strip())
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    conn = connect(path)
+    try:
+        return conn.execute(
+            f"SELECT id, datetime(created_at, 'unixepoch'), subject, name, email, message "
+            f"FROM contact_messages {where} ORDER BY created_at DESC LIMIT ?",
+            params + [limit],
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List contact form messages, newest first.")
+    parser.add_argument("--db", default=CONTACT_DB)
+    parser.add_argument("--subject")
+    parser.add_argument("--email")
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    for row_id, received, subject, name, email, message in query_inbox(
+            args.db, args.subject, args.email, args.limit):
+        print(f"#{row_id}  {received}  [{subject}]  {name} <{email}>")
+        print(f"    {message}")
+
+
+if __name__ == "__main__":
+    main()
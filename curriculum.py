@@ -0,0 +1,547 @@
+# Curriculum catalog: the single source of truth for the roadmap pages.
+#
+# Layout: branch -> stage (one tab, two semesters) -> semester -> subject -> weight.
+# The semester roadmap and GATE plan are stored as topic lists in the same
+# module so every page reads from one place.
+
+BRANCHES = {
+    "CSE": {
+        "title": "🖥️ Computer Science Engineering (CSE)",
+        "stages": [
+            {
+                "tab": "Foundation (Sem 1-2)",
+                "title": "Foundation Years",
+                "weightage": 25,
+                "semesters": {
+                    1: {
+                        "Engineering Mathematics I": 8,
+                        "Engineering Physics": 4,
+                        "Engineering Chemistry": 3,
+                        "Programming Fundamentals": 6,
+                        "Digital Logic Design": 4,
+                    },
+                    2: {
+                        "Engineering Mathematics II": 8,
+                        "Data Structures": 10,
+                        "Object-Oriented Programming": 6,
+                        "Computer Organization": 8,
+                    },
+                },
+            },
+            {
+                "tab": "Core CS (Sem 3-4)",
+                "title": "Core CS Years",
+                "weightage": 30,
+                "semesters": {
+                    3: {
+                        "Database Management Systems": 6,
+                        "Operating Systems": 8,
+                        "Computer Networks": 7,
+                        "Software Engineering": 5,
+                        "Theory of Computation": 4,
+                    },
+                    4: {
+                        "Advanced Data Structures": 5,
+                        "System Programming": 6,
+                        "Web Technologies": 4,
+                        "Elective I": 3,
+                    },
+                },
+            },
+            {
+                "tab": "Advanced CS (Sem 5-6)",
+                "title": "Advanced CS Years",
+                "weightage": 25,
+                "semesters": {
+                    5: {
+                        "Advanced Algorithms": 8,
+                        "Computer Architecture": 6,
+                        "Distributed Systems": 5,
+                        "Elective II": 6,
+                    },
+                    6: {
+                        "Compiler Design": 5,
+                        "Computer Graphics": 4,
+                        "Elective III": 6,
+                        "Project Work I": 10,
+                    },
+                },
+            },
+            {
+                "tab": "Specialization (Sem 7-8)",
+                "title": "Specialization Years",
+                "weightage": 20,
+                "semesters": {
+                    7: {
+                        "Advanced Topics": 10,
+                        "Internship": 5,
+                        "Research Methodology": 5,
+                    },
+                    8: {
+                        "Capstone Project": 15,
+                        "Professional Ethics": 3,
+                        "Elective IV": 2,
+                    },
+                },
+            },
+        ],
+    },
+    "IT": {
+        "title": "💻 Information Technology (IT)",
+        "stages": [
+            {
+                "tab": "Foundation (Sem 1-2)",
+                "title": "Foundation Years",
+                "weightage": 20,
+                "semesters": {
+                    1: {
+                        "Engineering Mathematics I": 8,
+                        "Programming Fundamentals": 8,
+                        "Digital Electronics": 4,
+                    },
+                    2: {
+                        "Engineering Mathematics II": 8,
+                        "Data Structures & Algorithms": 10,
+                        "Object-Oriented Programming": 8,
+                    },
+                },
+            },
+            {
+                "tab": "Core IT (Sem 3-4)",
+                "title": "Core IT Years",
+                "weightage": 35,
+                "semesters": {
+                    3: {
+                        "Database Management Systems": 8,
+                        "Web Development": 9,
+                        "Computer Networks": 6,
+                        "Software Engineering": 6,
+                    },
+                    4: {
+                        "Information Security": 8,
+                        "Mobile Application Development": 7,
+                        "Cloud Computing": 6,
+                    },
+                },
+            },
+            {
+                "tab": "Advanced IT (Sem 5-6)",
+                "title": "Advanced IT Years",
+                "weightage": 30,
+                "semesters": {
+                    5: {
+                        "Advanced Web Technologies": 8,
+                        "Data Science": 7,
+                        "DevOps & Automation": 6,
+                        "Elective I": 4,
+                    },
+                    6: {
+                        "Business Intelligence": 6,
+                        "Cybersecurity": 5,
+                        "Elective II": 4,
+                        "Project Work I": 10,
+                    },
+                },
+            },
+            {
+                "tab": "Specialization (Sem 7-8)",
+                "title": "Specialization Years",
+                "weightage": 15,
+                "semesters": {
+                    7: {
+                        "Advanced Topics": 8,
+                        "Industry Internship": 7,
+                    },
+                    8: {
+                        "Capstone Project": 10,
+                        "Professional Development": 5,
+                    },
+                },
+            },
+        ],
+    },
+    "ECE": {
+        "title": "🔌 Electronics & Communication Engineering (ECE)",
+        "stages": [
+            {
+                "tab": "Foundation (Sem 1-2)",
+                "title": "Foundation Years",
+                "weightage": 25,
+                "semesters": {
+                    1: {
+                        "Engineering Mathematics I": 8,
+                        "Engineering Physics": 6,
+                        "Basic Electronics": 6,
+                        "Programming for Engineers": 5,
+                    },
+                    2: {
+                        "Engineering Mathematics II": 8,
+                        "Digital Electronics": 8,
+                        "Analog Electronics": 8,
+                    },
+                },
+            },
+            {
+                "tab": "Core ECE (Sem 3-4)",
+                "title": "Core ECE Years",
+                "weightage": 30,
+                "semesters": {
+                    3: {
+                        "Signals & Systems": 7,
+                        "Electromagnetic Theory": 7,
+                        "Communication Systems": 8,
+                        "Microprocessors & Microcontrollers": 6,
+                    },
+                    4: {
+                        "Digital Signal Processing": 8,
+                        "VLSI Design": 3,
+                        "Wireless Communication": 5,
+                        "Elective I": 4,
+                    },
+                },
+            },
+            {
+                "tab": "Advanced ECE (Sem 5-6)",
+                "title": "Advanced ECE Years",
+                "weightage": 25,
+                "semesters": {
+                    5: {
+                        "Advanced Communication": 8,
+                        "Embedded Systems": 6,
+                        "Elective II": 6,
+                    },
+                    6: {
+                        "Advanced Signal Processing": 6,
+                        "Elective III": 6,
+                        "Elective IV": 4,
+                        "Project Work II": 9,
+                    },
+                },
+            },
+            {
+                "tab": "Specialization (Sem 7-8)",
+                "title": "Specialization Years",
+                "weightage": 20,
+                "semesters": {
+                    7: {
+                        "Advanced Topics": 10,
+                        "Industry Internship": 5,
+                        "Research Work": 5,
+                    },
+                    8: {
+                        "Capstone Project": 15,
+                        "Professional Ethics": 3,
+                        "Elective V": 2,
+                    },
+                },
+            },
+        ],
+    },
+}
+
+# Year -> semester -> (area, None, topics) shown on the Semester Roadmap page
+ROADMAP = [
+    {
+        "tab": "Year 1",
+        "title": "Year 1: Foundation Building",
+        "semesters": {
+            1: [
+                ("Mathematics", None, "Calculus, Linear Algebra, Differential Equations"),
+                ("Physics", None, "Mechanics, Waves, Optics"),
+                ("Chemistry", None, "Atomic Structure, Chemical Bonding"),
+                ("Programming", None, "C Programming Fundamentals"),
+                ("Digital Logic", None, "Boolean Algebra, Combinational Circuits"),
+            ],
+            2: [
+                ("Mathematics", None, "Probability, Statistics, Numerical Methods"),
+                ("Data Structures", None, "Arrays, Linked Lists, Stacks, Queues"),
+                ("OOP", None, "Java/C++ Programming"),
+                ("Computer Organization", None, "CPU Design, Memory Hierarchy"),
+            ],
+        },
+    },
+    {
+        "tab": "Year 2",
+        "title": "Year 2: Core Concepts",
+        "semesters": {
+            3: [
+                ("Databases", None, "ER Model, SQL, Normalization"),
+                ("Operating Systems", None, "Process Management, Memory Management"),
+                ("Networks", None, "OSI Model, TCP/IP, Routing"),
+                ("Software Engineering", None, "SDLC, UML, Testing"),
+            ],
+            4: [
+                ("Advanced Data Structures", None, "Trees, Graphs, Algorithms"),
+                ("System Programming", None, "Assembly, System Calls"),
+                ("Web Technologies", None, "HTML, CSS, JavaScript"),
+                ("Electives", None, "Specialized topics"),
+            ],
+        },
+    },
+    {
+        "tab": "Year 3",
+        "title": "Year 3: Advanced Topics",
+        "semesters": {
+            5: [
+                ("Advanced Algorithms", None, "Graph Algorithms, Dynamic Programming"),
+                ("Computer Architecture", None, "Advanced CPU Design"),
+                ("Distributed Systems", None, "Distributed Algorithms"),
+                ("Electives", None, "Advanced topics"),
+            ],
+            6: [
+                ("Compiler Design", None, "Lexical Analysis, Parsing"),
+                ("Computer Graphics", None, "2D/3D Graphics"),
+                ("Electives", None, "Specialized topics"),
+                ("Project Work", None, "Industry projects"),
+            ],
+        },
+    },
+    {
+        "tab": "Year 4",
+        "title": "Year 4: Specialization & Projects",
+        "semesters": {
+            7: [
+                ("Advanced Topics", None, "Specialized electives"),
+                ("Internship", None, "Industry experience"),
+                ("Research", None, "Research methodology"),
+            ],
+            8: [
+                ("Capstone Project", None, "Major project work"),
+                ("Professional Ethics", None, "Engineering ethics"),
+                ("Electives", None, "Final specialization"),
+            ],
+        },
+    },
+]
+
+# GATE phase -> week block -> (topic, weight %, details). Weight is None for
+# practice blocks that have no syllabus share.
+GATE_PLAN = [
+    {
+        "tab": "Phase 1 (Months 1-3)",
+        "title": "Phase 1: Foundation Building",
+        "blocks": [
+            {
+                "weeks": "1-4",
+                "title": "Engineering Mathematics",
+                "weightage": 15,
+                "target": "12-15",
+                "topics": [
+                    ("Linear Algebra", 5, "Matrices, Determinants, Vector Spaces"),
+                    ("Calculus", 4, "Limits, Continuity, Differentiation"),
+                    ("Probability & Statistics", 3, "Probability Distributions"),
+                    ("Discrete Mathematics", 3, "Logic, Sets, Relations"),
+                ],
+            },
+            {
+                "weeks": "5-8",
+                "title": "Programming & Data Structures",
+                "weightage": 15,
+                "target": "12-15",
+                "topics": [
+                    ("C Programming", 5, "Data Types, Operators, Control Structures"),
+                    ("Data Structures", 10, "Arrays, Linked Lists, Trees, Graphs"),
+                ],
+            },
+            {
+                "weeks": "9-12",
+                "title": "Algorithms",
+                "weightage": 10,
+                "target": "8-10",
+                "topics": [
+                    ("Searching & Sorting", 3, "Linear Search, Binary Search, Quick Sort"),
+                    ("Graph Algorithms", 4, "BFS, DFS, Shortest Path"),
+                    ("Dynamic Programming", 3, "Memoization, Tabulation"),
+                ],
+            },
+        ],
+    },
+    {
+        "tab": "Phase 2 (Months 4-6)",
+        "title": "Phase 2: Core Subjects",
+        "blocks": [
+            {
+                "weeks": "13-16",
+                "title": "Computer Organization",
+                "weightage": 10,
+                "target": "8-10",
+                "topics": [
+                    ("Digital Logic", 3, "Boolean Algebra, Combinational Circuits"),
+                    ("CPU Design", 4, "ALU, Control Unit, Registers"),
+                    ("Memory Hierarchy", 3, "Cache, RAM, ROM, Virtual Memory"),
+                ],
+            },
+            {
+                "weeks": "17-20",
+                "title": "Operating Systems",
+                "weightage": 10,
+                "target": "8-10",
+                "topics": [
+                    ("Process Management", 3, "Process Scheduling, Synchronization"),
+                    ("Memory Management", 4, "Paging, Segmentation, Virtual Memory"),
+                    ("File Systems", 3, "File Organization, Directory Structure"),
+                ],
+            },
+            {
+                "weeks": "21-24",
+                "title": "Database Systems",
+                "weightage": 8,
+                "target": "6-8",
+                "topics": [
+                    ("Data Modeling", 3, "ER Model, Relational Model, Normalization"),
+                    ("SQL", 3, "DDL, DML, DCL, Advanced Queries"),
+                    ("Database Design", 2, "Indexing, Query Optimization"),
+                ],
+            },
+        ],
+    },
+    {
+        "tab": "Phase 3 (Months 7-9)",
+        "title": "Phase 3: Advanced Topics",
+        "blocks": [
+            {
+                "weeks": "25-28",
+                "title": "Computer Networks",
+                "weightage": 8,
+                "target": "6-8",
+                "topics": [
+                    ("Network Models", 3, "OSI Model, TCP/IP Model"),
+                    ("Data Link Layer", 2, "Error Detection, Flow Control"),
+                    ("Network Layer", 3, "Routing Algorithms, IP Addressing"),
+                ],
+            },
+            {
+                "weeks": "29-32",
+                "title": "Theory of Computation",
+                "weightage": 6,
+                "target": "4-6",
+                "topics": [
+                    ("Automata Theory", 3, "DFA, NFA, Regular Expressions"),
+                    ("Computability", 2, "Turing Machines, Halting Problem"),
+                    ("Complexity Theory", 1, "P, NP, NP-Complete Problems"),
+                ],
+            },
+            {
+                "weeks": "33-36",
+                "title": "Software Engineering",
+                "weightage": 4,
+                "target": "3-4",
+                "topics": [
+                    ("Software Development Life Cycle", 2, "Waterfall, Agile, Spiral Models"),
+                    ("Software Testing", 1, "Unit Testing, Integration Testing"),
+                    ("Project Management", 1, "Estimation, Scheduling, Risk Management"),
+                ],
+            },
+        ],
+    },
+    {
+        "tab": "Phase 4 (Months 10-12)",
+        "title": "Phase 4: Practice & Revision",
+        "blocks": [
+            {
+                "weeks": "37-40",
+                "title": "Mock Tests",
+                "topics": [
+                    ("Daily", None, "1 full-length mock test"),
+                    ("Weekly", None, "Topic-wise revision"),
+                    ("Analysis", None, "Identify weak areas"),
+                ],
+            },
+            {
+                "weeks": "41-44",
+                "title": "Previous Year Papers",
+                "topics": [
+                    ("Daily", None, "1 previous year paper"),
+                    ("Weekly", None, "Pattern analysis"),
+                    ("Focus", None, "Frequently asked topics"),
+                ],
+            },
+            {
+                "weeks": "45-48",
+                "title": "Final Revision",
+                "topics": [
+                    ("Daily", None, "Quick revision of formulas"),
+                    ("Weekly", None, "Full-length tests"),
+                    ("Focus", None, "Time management"),
+                ],
+            },
+        ],
+    },
+]
+
+
+def build_catalog():
+    """
+    Bundle the curriculum data with lookup indexes by branch, semester and subject
+    """
+    by_semester = {}
+    by_subject = {}
+    for code, branch in BRANCHES.items():
+        for stage in branch["stages"]:
+            for semester, subjects in stage["semesters"].items():
+                by_semester.setdefault(semester, {})[code] = subjects
+                for subject, weight in subjects.items():
+                    by_subject.setdefault(subject, []).append((code, semester, weight))
+
+    return {
+        "branches": BRANCHES,
+        "roadmap": ROADMAP,
+        "gate": GATE_PLAN,
+        "by_branch": {code: branch["stages"] for code, branch in BRANCHES.items()},
+        "by_semester": by_semester,
+        "by_subject": by_subject,
+    }
+
+
+def topic_lines(topics):
+    """
+    Format (name, weight, details) topics as markdown bullet lines
+    """
+    lines = []
+    for name, weight, details in topics:
+        if weight is None:
+            lines.append(f"- **{name}**: {details}")
+        else:
+            lines.append(f"- **{name}** ({weight}%): {details}")
+    return "\n".join(lines)
+
+
+def syllabus_topics(block):
+    """
+    (name, details) of a GATE block's weighted topics; none for blocks without weightage
+    """
+    if "weightage" not in block:
+        return []
+    return [(name, details) for name, weight, details in block["topics"] if weight is not None]
+
+
+def topic_texts(catalog):
+    """
+    Map every subject and GATE topic name to the text describing it, for
+    matching against lecture transcripts
+
+    Only weighted topics of syllabus blocks count; the mock test phase's
+    "Daily"/"Weekly" schedule lines are not topics.
+    """
+    texts = {subject: subject for subject in catalog["by_subject"]}
+    for phase in catalog["gate"]:
+        for block in phase["blocks"]:
+            for name, details in syllabus_topics(block):
+                texts[name] = f"{texts.get(name, name)} {details}"
+    return texts
+
+
+def progress_items(catalog):
+    """
+    Map every progress track (branch code or "GATE") to its trackable items:
+    "<semester>/<subject>" for branches and the week range for GATE blocks
+    """
+    items = {
+        code: [f"{semester}/{subject}"
+               for stage in stages
+               for semester, subjects in stage["semesters"].items()
+               for subject in subjects]
+        for code, stages in catalog["by_branch"].items()
+    }
+    items["GATE"] = [block["weeks"] for phase in catalog["gate"] for block in phase["blocks"]]
+    return items
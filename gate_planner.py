@@ -0,0 +1,94 @@
+# GATE study planner: split the weeks before the exam between subjects so the
+# expected score is as high as possible.
+#
+# Each subject's expected marks rise with study hours with diminishing
+# returns, from a starting level set by the student's self-rated strength:
+#
+#   marks = weightage * (1 - (1 - start) * exp(-hours / (HOURS_PER_MARK * weightage)))
+#
+# With concave gains like these, handing out weeks one at a time to the
+# subject with the largest marginal gain is optimal. The allocation for n
+# weeks is the allocation for n - 1 weeks plus one, so the solver is memoized
+# per week count and moving the weeks slider only computes the difference.
+
+import functools
+import math
+from collections import namedtuple
+
+# Study hours that close about 63% of the gap to full marks, per mark of weightage
+HOURS_PER_MARK = 6
+
+# Share of the weeks kept for mock tests and revision, as in the fixed plan
+REVISION_SHARE = 0.25
+
+# Self-rated strength (1-5) -> share of the subject already mastered
+STRENGTH_LEVELS = {1: 0.0, 2: 0.2, 3: 0.4, 4: 0.6, 5: 0.8}
+
+Subject = namedtuple("Subject", "title weightage")
+StudyBlock = namedtuple("StudyBlock", "weeks title hours expected weightage")
+Plan = namedtuple("Plan", "blocks expected max_score study_weeks revision_weeks")
+
+
+def gate_subjects(gate_plan):
+    """
+    The week blocks of the GATE plan that carry syllabus weightage, in order
+    """
+    return tuple(
+        Subject(block["title"], block["weightage"])
+        for phase in gate_plan
+        for block in phase["blocks"]
+        if "weightage" in block
+    )
+
+
+def expected_marks(weightage, strength, hours):
+    start = STRENGTH_LEVELS[strength]
+    return weightage * (1 - (1 - start) * math.exp(-hours / (HOURS_PER_MARK * weightage)))
+
+
+@functools.lru_cache(maxsize=4096)
+def allocate(weightages, strengths, weeks, hours_per_week):
+    """
+    Study weeks per subject that maximize the expected score
+    """
+    if weeks == 0:
+        return (0,) * len(weightages)
+
+    previous = allocate(weightages, strengths, weeks - 1, hours_per_week)
+
+    def gain(i):
+        hours = previous[i] * hours_per_week
+        return (expected_marks(weightages[i], strengths[i], hours + hours_per_week)
+                - expected_marks(weightages[i], strengths[i], hours))
+
+    best = max(range(len(weightages)), key=gain)
+    return previous[:best] + (previous[best] + 1,) + previous[best + 1:]
+
+
+@functools.lru_cache(maxsize=256)
+def build_plan(subjects, strengths, weeks, hours_per_week):
+    """
+    Week-by-week plan: subjects in syllabus order, then revision weeks
+    """
+    revision_weeks = max(1, round(weeks * REVISION_SHARE))
+    study_weeks = max(0, weeks - revision_weeks)
+    weightages = tuple(subject.weightage for subject in subjects)
+    allocation = allocate(weightages, strengths, study_weeks, hours_per_week)
+
+    blocks = []
+    week = 1
+    for subject, strength, count in zip(subjects, strengths, allocation):
+        hours = count * hours_per_week
+        if count:
+            weeks_label = f"{week}-{week + count - 1}" if count > 1 else str(week)
+            week += count
+        else:
+            weeks_label = "-"
+        blocks.append(StudyBlock(weeks_label, subject.title, hours,
+                                 expected_marks(subject.weightage, strength, hours), subject.weightage))
+    if revision_weeks:
+        blocks.append(StudyBlock(f"{week}-{weeks}" if revision_weeks > 1 else str(week),
+                                 "Mock Tests & Revision", revision_weeks * hours_per_week, None, None))
+
+    return Plan(tuple(blocks), sum(block.expected for block in blocks if block.expected is not None),
+                sum(weightages), study_weeks, revision_weeks)
@@ -0,0 +1,307 @@
+# Per-page render metrics in the Prometheus text format.
+#
+# Turned on by environment variables, off (and close to free) otherwise:
+#   ROADMAP_METRICS_FILE=/var/lib/node_exporter/roadmap.prom  write a text file
+#   ROADMAP_METRICS_PORT=9464                                 serve /metrics over HTTP
+
+import bisect
+import collections
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+METRICS_FILE = os.environ.get("ROADMAP_METRICS_FILE")
+METRICS_PORT = os.environ.get("ROADMAP_METRICS_PORT")
+ENABLED = bool(METRICS_FILE or METRICS_PORT)
+
+# Upper bounds of the render latency histogram, in seconds
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Minimum seconds between two rewrites of the metrics file
+FILE_INTERVAL = 5.0
+
+_lock = threading.Lock()
+_pages = {}
+_fragments = {}
+_caches = {}
+# Session ID -> page it is on (last started rendering), for sessions that are still open
+_sessions = {}
+_sessions_started = 0
+_last_write = 0.0
+_server = None
+
+
+def _render_stats(table, key):
+    stats = table.get(key)
+    if stats is None:
+        stats = table[key] = {
+            "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+            "seconds": 0.0,
+            "views": 0,
+            "elements": 0,
+        }
+    return stats
+
+
+def _note_session(session_id, page):
+    global _sessions_started
+    if session_id not in _sessions:
+        _sessions_started += 1
+        _prune_sessions()
+    _sessions[session_id] = page
+
+
+def _prune_sessions():
+    # Forget sessions the runtime has closed, so the gauges count open ones
+    if not runtime.exists():
+        return
+    instance = runtime.get_instance()
+    for session_id in [session_id for session_id in _sessions if not instance.is_active_session(session_id)]:
+        del _sessions[session_id]
+
+
+@contextmanager
+def _track(page, fragment=None):
+    ctx = get_script_run_ctx()
+    elements = 0
+
+    # Count the delta messages the page sends by shadowing the context's enqueue
+    if ctx is not None:
+        enqueue = ctx.enqueue
+
+        def counting_enqueue(msg):
+            nonlocal elements
+            if msg.HasField("delta"):
+                elements += 1
+            enqueue(msg)
+
+        ctx.enqueue = counting_enqueue
+
+    # Recorded up front so cache lookups during the render know their page
+    if ctx is not None and fragment is None:
+        with _lock:
+            _note_session(ctx.session_id, page)
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        if ctx is not None:
+            del ctx.enqueue
+
+        with _lock:
+            stats = _render_stats(_pages, page) if fragment is None else _render_stats(_fragments, (page, fragment))
+            stats["buckets"][bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats["seconds"] += seconds
+            stats["views"] += 1
+            stats["elements"] += elements
+        _export()
+
+
+def track_page(page):
+    """
+    Context manager timing one render of page; a no-op when metrics are off
+    """
+    if not ENABLED:
+        return nullcontext()
+    return _track(page)
+
+
+def track_fragment(name):
+    """
+    Context manager timing a rerun of fragment name on its own
+
+    Full runs are already timed by track_page, so this is a no-op during
+    them, as it is when metrics are off.
+    """
+    if not ENABLED:
+        return nullcontext()
+    ctx = get_script_run_ctx()
+    if ctx is None or not ctx.fragment_ids_this_run:
+        return nullcontext()
+    with _lock:
+        page = _sessions.get(ctx.session_id, "")
+    return _track(page, name)
+
+
+def fragment(name):
+    """
+    st.fragment whose reruns are timed as fragment name of the current page
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            with track_fragment(name):
+                return func(*args, **kwargs)
+
+        return st.fragment(timed)
+
+    return decorate
+
+
+def _count_cache(name, field):
+    if not ENABLED:
+        return
+    ctx = get_script_run_ctx()
+    with _lock:
+        page = _sessions.get(ctx.session_id, "") if ctx is not None else ""
+        stats = _caches.setdefault((name, page), {"requests": 0, "misses": 0})
+        stats[field] += 1
+
+
+def count_cache(name, cache):
+    """
+    Apply a Streamlit cache decorator and count its requests and misses as
+    name, per page of the session doing the lookup
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def miss(*args, **kwargs):
+            # Only runs when the cache has no entry for these arguments
+            _count_cache(name, "misses")
+            return func(*args, **kwargs)
+
+        cached = cache(miss)
+
+        @functools.wraps(func)
+        def lookup(*args, **kwargs):
+            _count_cache(name, "requests")
+            return cached(*args, **kwargs)
+
+        lookup.clear = cached.clear
+        return lookup
+
+    return decorate
+
+
+def render():
+    """
+    Return all metrics in the Prometheus text exposition format
+    """
+    lines = []
+    with _lock:
+        _prune_sessions()
+        pages = {f'page="{_label(page)}"': stats for page, stats in _pages.items()}
+        fragments = {f'page="{_label(page)}",fragment="{_label(name)}"': stats
+                     for (page, name), stats in _fragments.items()}
+
+        _render_histogram(lines, "roadmap_page_render_seconds", "Time spent rendering a page.", pages)
+        _render_histogram(lines, "roadmap_fragment_render_seconds",
+                          "Time spent rerunning a fragment on its own.", fragments)
+
+        lines += [
+            "# HELP roadmap_page_elements_total Elements sent while rendering a page.",
+            "# TYPE roadmap_page_elements_total counter",
+        ]
+        for labels, stats in pages.items():
+            lines.append(f'roadmap_page_elements_total{{{labels}}} {stats["elements"]}')
+
+        lines += [
+            "# HELP roadmap_fragment_elements_total Elements sent while rerunning a fragment.",
+            "# TYPE roadmap_fragment_elements_total counter",
+        ]
+        for labels, stats in fragments.items():
+            lines.append(f'roadmap_fragment_elements_total{{{labels}}} {stats["elements"]}')
+
+        lines += [
+            "# HELP roadmap_page_sessions Open sessions currently on a page.",
+            "# TYPE roadmap_page_sessions gauge",
+        ]
+        open_pages = collections.Counter(_sessions.values())
+        for page in _pages:
+            lines.append(f'roadmap_page_sessions{{page="{_label(page)}"}} {open_pages[page]}')
+
+        lines += [
+            "# HELP roadmap_sessions Open sessions that have rendered a page.",
+            "# TYPE roadmap_sessions gauge",
+            f"roadmap_sessions {len(_sessions)}",
+            "# HELP roadmap_sessions_started_total Sessions that rendered their first page.",
+            "# TYPE roadmap_sessions_started_total counter",
+            f"roadmap_sessions_started_total {_sessions_started}",
+            "# HELP roadmap_cache_requests_total Lookups per cache and page.",
+            "# TYPE roadmap_cache_requests_total counter",
+        ]
+        caches = {f'cache="{name}",page="{_label(page)}"': stats for (name, page), stats in _caches.items()}
+        for labels, stats in caches.items():
+            lines.append(f'roadmap_cache_requests_total{{{labels}}} {stats["requests"]}')
+
+        lines += [
+            "# HELP roadmap_cache_misses_total Lookups that had to compute the value.",
+            "# TYPE roadmap_cache_misses_total counter",
+        ]
+        for labels, stats in caches.items():
+            lines.append(f'roadmap_cache_misses_total{{{labels}}} {stats["misses"]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def _render_histogram(lines, name, description, series):
+    lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+    for labels, stats in series.items():
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), stats["buckets"]):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{{labels}}} {stats["seconds"]:.6f}')
+        lines.append(f'{name}_count{{{labels}}} {stats["views"]}')
+
+
+def _label(value):
+    # Escape a value for use inside a quoted Prometheus label
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _export():
+    global _last_write
+    if not METRICS_FILE:
+        return
+
+    now = time.monotonic()
+    with _lock:
+        if now - _last_write < FILE_INTERVAL:
+            return
+        _last_write = now
+
+    # Write then rename, so a scraper never reads a half-written file
+    tmp_path = f"{METRICS_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp_path, METRICS_FILE)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    """
+    Serve /metrics on ROADMAP_METRICS_PORT from a daemon thread, once per process
+    """
+    global _server
+    if not METRICS_PORT:
+        return
+    with _lock:
+        if _server is not None:
+            return
+        _server = ThreadingHTTPServer(("127.0.0.1", int(METRICS_PORT)), _MetricsHandler)
+    threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
@@ -0,0 +1,195 @@
+# Student progress storage: which subjects and GATE week blocks each student
+# has marked as done, in a SQLite database.
+#
+# Only completed items are stored, one row each, so the table grows with
+# students x items and not with the number of clicks. Writes go through a
+# write-behind queue (sqlite_writer.BatchWriter), which retries failed batches;
+# reads see queued writes at once.
+# Readers borrow connections from a small per-process pool. Print the cohort
+# completion per track with:
+#
+#   python progress_store.py
+#   python progress_store.py --student 21CS042
+
+import argparse
+import itertools
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import sqlite_writer
+
+PROGRESS_DB = os.environ.get("ROADMAP_PROGRESS_DB", "progress.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    student TEXT NOT NULL,
+    track TEXT NOT NULL,
+    item TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (student, track, item)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS progress_item
+    ON progress (track, item);
+CREATE INDEX IF NOT EXISTS progress_track_student
+    ON progress (track, student);
+"""
+
+
+def connect(path):
+    return sqlite_writer.connect(path, SCHEMA)
+
+
+class ConnectionPool:
+    """
+    Reuse up to size idle connections instead of opening one per query
+    """
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = connect(self.path)
+        try:
+            yield conn
+        finally:
+            if self._idle.qsize() < self.size:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class ProgressStore:
+    def __init__(self, path=PROGRESS_DB, batch_size=500, flush_interval=0.5, pool_size=4):
+        self.path = path
+        self._sequence = itertools.count()
+        # (student, track, item) -> (sequence, done) for writes not committed yet
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._writer = sqlite_writer.BatchWriter(path, SCHEMA, self._apply, "progress-writer",
+                                                 batch_size, flush_interval)
+        self.pool = ConnectionPool(path, pool_size)
+
+    def set_done(self, student, track, items, done=True):
+        """
+        Queue marking items of track as done (or not done) for student
+        """
+        now = time.time()
+        with self._pending_lock:
+            for item in items:
+                key = (student, track, item)
+                sequence = next(self._sequence)
+                self._pending[key] = (sequence, done)
+                self._writer.put((key, sequence, done, now))
+
+    @property
+    def healthy(self):
+        """
+        False while queued writes are failing to reach the database
+        """
+        return self._writer.healthy
+
+    def completed(self, student, track=None):
+        """
+        Set of (track, item) the student has done, including queued writes
+        """
+        # Snapshot queued writes first: anything committed after this is
+        # already in the database by the time it is read
+        with self._pending_lock:
+            pending = [(pending_track, item, done)
+                       for (pending_student, pending_track, item), (_, done) in self._pending.items()
+                       if pending_student == student and track in (None, pending_track)]
+
+        sql = "SELECT track, item FROM progress WHERE student = ?"
+        params = [student]
+        if track is not None:
+            sql += " AND track = ?"
+            params.append(track)
+        with self.pool.connection() as conn:
+            completed = set(conn.execute(sql, params).fetchall())
+
+        for pending_track, item, done in pending:
+            if done:
+                completed.add((pending_track, item))
+            else:
+                completed.discard((pending_track, item))
+        return completed
+
+    def track_summary(self):
+        """
+        (track, students, completions) for every track with progress
+        """
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "SELECT track, COUNT(DISTINCT student), COUNT(*) FROM progress GROUP BY track ORDER BY track"
+            ).fetchall()
+
+    def item_counts(self, track):
+        """
+        {item: students who completed it} for one track
+        """
+        with self.pool.connection() as conn:
+            return dict(conn.execute(
+                "SELECT item, COUNT(*) FROM progress WHERE track = ? GROUP BY item", (track,)
+            ).fetchall())
+
+    def _apply(self, conn, batch):
+        # Only the last write to an item in the batch matters
+        latest = {key: (sequence, done, at) for key, sequence, done, at in batch}
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO progress (student, track, item, completed_at) VALUES (?, ?, ?, ?)",
+                [(*key, at) for key, (_, done, at) in latest.items() if done],
+            )
+            conn.executemany(
+                "DELETE FROM progress WHERE student = ? AND track = ? AND item = ?",
+                [key for key, (_, done, _) in latest.items() if not done],
+            )
+
+        with self._pending_lock:
+            for key, (sequence, _, _) in latest.items():
+                # A newer write to the same item stays pending
+                if self._pending.get(key, (None,))[0] == sequence:
+                    del self._pending[key]
+
+    def close(self):
+        """
+        Flush queued writes and stop the writer thread
+        """
+        self._writer.close()
+        self.pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show recorded student progress.")
+    parser.add_argument("--db", default=PROGRESS_DB)
+    parser.add_argument("--student", help="list one student's completed items")
+    args = parser.parse_args()
+
+    store = ProgressStore(args.db)
+    if args.student:
+        for track, item in sorted(store.completed(args.student)):
+            print(f"{track}  {item}")
+    else:
+        for track, students, completions in store.track_summary():
+            print(f"{track}: {students} student(s), {completions} completed item(s)")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# SQLite plumbing shared by contact_store.py and progress_store.py: opening a
+# database in WAL mode, and a write-behind queue that a background thread
+# drains into the database in batches, so Streamlit reruns never wait on disk.
+#
+# A batch that fails to write (a locked or full database, say) is logged and
+# retried with growing pauses until it succeeds, so nothing queued is dropped
+# while the process runs. The writer reports itself unhealthy meanwhile.
+
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def connect(path, schema):
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL keeps the database consistent with NORMAL; only the last commits
+    # can be lost on power failure
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(schema)
+    return conn
+
+
+class BatchWriter:
+    """
+    Background thread that hands queued rows to write_batch(conn, rows)
+
+    Rows that arrive within flush_interval of each other are written together,
+    up to batch_size at a time. write_batch runs on the writer thread and
+    manages its own transaction, so a batch that raises leaves nothing behind
+    and can be written again.
+    """
+
+    def __init__(self, path, schema, write_batch, name, batch_size=100, flush_interval=0.5,
+                 retry_delay=0.5, max_retry_delay=30.0):
+        self.path = path
+        self.schema = schema
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.failed_batches = 0
+        self._failing = False
+        self._closing = threading.Event()
+        self._queue = queue.Queue()
+
+        # Create the schema up front so readers never see a missing table
+        connect(path, schema).close()
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, row):
+        self._queue.put(row)
+
+    @property
+    def healthy(self):
+        """
+        False while a batch is failing to write, or if the thread has stopped
+        """
+        return self._thread.is_alive() and not self._failing
+
+    def _run(self):
+        conn = connect(self.path, self.schema)
+        while True:
+            row = self._queue.get()
+            if row is None:
+                break
+
+            batch = [row]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                    break
+                batch.append(row)
+
+            self._write(conn, batch)
+            if stop:
+                break
+        conn.close()
+
+    def _write(self, conn, batch):
+        delay = self.retry_delay
+        while True:
+            try:
+                self.write_batch(conn, batch)
+            except Exception:
+                self.failed_batches += 1
+                self._failing = True
+                if self._closing.is_set():
+                    logger.exception("%s: dropping %d row(s) that could not be written at shutdown",
+                                     self._thread.name, len(batch))
+                    return
+                logger.exception("%s: writing %d row(s) failed, retrying in %.1fs",
+                                 self._thread.name, len(batch), delay)
+                # close() cuts the pause short for one last attempt
+                self._closing.wait(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+            else:
+                self._failing = False
+                return
+
+    def close(self):
+        """
+        Write everything queued and stop the thread
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._closing.set()
+            self._thread.join()
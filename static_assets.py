@@ -0,0 +1,111 @@
+# Stylesheets and HTML templates kept in assets/ instead of inline strings.
+#
+# Stylesheets are copied to static/ under content-hashed names
+# (style.3f2a9c1b7e4d.css) and linked from the page, so a browser loads each
+# version once and the rerun only sends a <link> tag. Streamlit serves static/
+# at app/static/ when server.enableStaticServing is on (.streamlit/config.toml)
+# but sends no Cache-Control header, so set a long-lived one in front of it:
+#
+#   location /app/static/ {
+#       proxy_pass http://127.0.0.1:8501;
+#       add_header Cache-Control "public, max-age=31536000, immutable";
+#   }
+#
+# The app builds missing files on first use. Deploys can build ahead of time,
+# which also removes superseded versions:
+#
+#   python static_assets.py
+
+import argparse
+import functools
+import glob
+import hashlib
+import os
+from string import Template
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(ROOT, "assets")
+STATIC_DIR = os.path.join(ROOT, "static")
+
+# URL prefix Streamlit serves STATIC_DIR under, relative to the page
+STATIC_URL = "app/static"
+
+STYLESHEETS = ["style.css"]
+
+
+def read_asset(name):
+    with open(os.path.join(ASSETS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def hashed_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+
+
+def build(static_dir=STATIC_DIR, prune=False):
+    """
+    Write every stylesheet to static_dir under its hashed name
+
+    Returns {name: hashed name}. With prune, other versions of the same
+    stylesheets are deleted.
+    """
+    os.makedirs(static_dir, exist_ok=True)
+    built = {}
+    for name in STYLESHEETS:
+        data = read_asset(name).encode("utf-8")
+        target = hashed_name(name, data)
+        path = os.path.join(static_dir, target)
+        if not os.path.exists(path):
+            with open(f"{path}.tmp", "wb") as f:
+                f.write(data)
+            os.replace(f"{path}.tmp", path)
+        built[name] = target
+
+        if prune:
+            stem, ext = os.path.splitext(name)
+            for old in glob.glob(os.path.join(glob.escape(static_dir), f"{stem}.*{ext}")):
+                if os.path.basename(old) != target:
+                    os.remove(old)
+    return built
+
+
+@functools.lru_cache(maxsize=None)
+def stylesheet_html(static_serving):
+    """
+    Markup that applies the stylesheets: <link> tags to the hashed files, or
+    inline <style> when static serving is off or static/ is not writable
+    """
+    if static_serving:
+        try:
+            built = build()
+        except OSError:
+            pass
+        else:
+            return "".join(f'<link rel="stylesheet" href="{STATIC_URL}/{built[name]}">' for name in STYLESHEETS)
+    return "".join(f"<style>\n{read_asset(name)}</style>" for name in STYLESHEETS)
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(name):
+    return Template(read_asset(os.path.join("templates", name)))
+
+
+def render_template(name, **fields):
+    """
+    Fill in assets/templates/<name>; fields are inserted as given
+    """
+    return load_template(name).substitute(fields)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build content-hashed stylesheets into static/.")
+    parser.add_argument("--out", default=STATIC_DIR)
+    args = parser.parse_args()
+
+    for name, target in build(args.out, prune=True).items():
+        print(f"{name} -> {os.path.join(args.out, target)}")
+
+
+if __name__ == "__main__":
+    main()
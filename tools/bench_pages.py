@@ -0,0 +1,120 @@
+"""
+Headless rerun benchmark for every page and section of app.py.
+
+Drives the app with streamlit.testing.v1.AppTest, no browser needed. For each
+page in views.PAGES, and each section of the tabbed pages, it records rerun wall
+time and element count over N reruns, plus the peak Python memory of one
+traced rerun.
+
+    python tools/bench_pages.py --iterations 20 --json bench.json
+    python tools/bench_pages.py --baseline bench.json --threshold 0.25
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import regression  # noqa: E402
+from views import PAGES  # noqa: E402
+
+# Metrics compared against the baseline; lower is better for all of them
+COMPARED = ["wall_ms_median", "elements", "peak_kib"]
+
+
+def count_elements(node):
+    """
+    Count the blocks and elements below node, i.e. the deltas a rerun sends
+    """
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return 1 + sum(count_elements(child) for child in children.values())
+
+
+def page_elements(at):
+    # The root and the main/sidebar/event containers are always there
+    return sum(count_elements(block) - 1 for block in at._tree.children.values())
+
+
+def measure(at, iterations):
+    """
+    Rerun the current page iterations times and summarize the cost
+    """
+    wall_ms = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        at.run()
+        wall_ms.append((time.perf_counter() - start) * 1000)
+
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    # tracemalloc slows Python down a lot, so memory gets its own rerun
+    tracemalloc.start()
+    at.run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    wall_ms.sort()
+    return {
+        "wall_ms_median": round(statistics.median(wall_ms), 2),
+        "wall_ms_p95": round(wall_ms[int(0.95 * (len(wall_ms) - 1))], 2),
+        "wall_ms_min": round(wall_ms[0], 2),
+        "elements": page_elements(at),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_benchmark(iterations):
+    os.chdir(ROOT)
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60).run()
+    results = {}
+    for spec in PAGES:
+        page = spec.label
+        at.switch_page(spec.path).run()
+
+        # Tabbed pages render one section at a time behind a radio control
+        sections = at.radio[0].options if at.radio else [None]
+        for index, section in enumerate(sections):
+            if section is not None:
+                at.radio[0].set_value(index).run()
+            name = page if section is None else f"{page} / {section}"
+            results[name] = measure(at, iterations)
+            print(f"{name}: {results[name]}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Return a message for every metric of a page that grew by more than threshold
+    """
+    return [f"{name}: {message}"
+            for name, metrics in results.items() if name in baseline
+            for message in regression.compare(metrics, baseline[name], COMPARED, threshold)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10, help="reruns per page")
+    regression.add_arguments(parser)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.iterations)
+
+    if args.json:
+        regression.save(args.json, {"iterations": args.iterations, "results": results})
+
+    if args.baseline:
+        regression.check(args.baseline, lambda baseline: compare(results, baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Export the read-only pages of app.py as a static site.
+
+Every page is run headlessly with streamlit.testing.v1.AppTest, and its
+element tree is written out as plain HTML. Sections behind a radio selector
+are all rendered, one after another, with links to each. Analytics charts
+become static Plotly figures. Assets get content-hashed file names, so a file
+server can cache them forever:
+
+    python tools/export_static.py --out site --app-url https://roadmap.example.com
+
+Widgets have no static equivalent. Forms are replaced by a link to the live
+app (--app-url), which keeps serving interactive traffic.
+"""
+
+import argparse
+import html
+import os
+import re
+import shutil
+import sys
+import textwrap
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from static_assets import STYLESHEETS, hashed_name, read_asset  # noqa: E402
+from views import INTERACTIVE_KEY_PREFIX, section_slug  # noqa: E402
+from views import PAGES as VIEWS  # noqa: E402
+
+# Pages that are all interactive, with nothing to show statically
+LIVE_ONLY_PAGES = {"lecture-search", "transcripts"}
+
+# Page label -> output file, named after the page's URL path
+PAGES = {
+    spec.label: f"{spec.url_path or 'index'}.html"
+    for spec in VIEWS
+    if spec.url_path not in LIVE_ONLY_PAGES
+}
+
+# Written into the output directory; only a directory holding it is replaced
+MARKER_FILE = ".export-static"
+
+# Layout for the pieces Streamlit normally styles itself
+SITE_CSS = """
+body { font-family: "Source Sans Pro", sans-serif; margin: 0; display: flex; color: #31333f; }
+nav.pages { width: 16rem; min-height: 100vh; background: #f0f2f6; padding: 1.5rem 1rem; box-sizing: border-box; }
+nav.pages a { display: block; padding: 0.4rem 0.5rem; color: inherit; text-decoration: none; border-radius: 6px; }
+nav.pages a.active { background: #dfe3eb; font-weight: bold; }
+main { flex: 1; padding: 1rem 3rem; max-width: 80rem; }
+.columns { display: flex; gap: 1rem; }
+.columns > .column { flex: 1; min-width: 0; }
+nav.sections a { margin-right: 1rem; }
+.stat { padding: 0.5rem 0; }
+.stat-label { font-size: 0.9rem; }
+.stat-value { font-size: 2.25rem; }
+.caption { color: #6b6f76; font-size: 0.875rem; }
+.live-app { padding: 1rem; background: #e3f2fd; border-radius: 8px; }
+details { border: 1px solid #e6e9ef; border-radius: 8px; padding: 0.5rem 1rem; margin: 0.5rem 0; }
+"""
+
+SECTION_MARKER = "<!-- sections -->"
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_BULLET = re.compile(r"^[-*]\s+(.*)$")
+_NUMBERED = re.compile(r"^\d+\.\s+(.*)$")
+_INLINE = [
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![*\w])\*(?!\s)(.+?)\*(?!\w)"), r"<em>\1</em>"),
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)"), r'<a href="\2">\1</a>'),
+]
+
+
+def inline_markdown(text):
+    for pattern, replacement in _INLINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def markdown_to_html(text):
+    """
+    Convert the markdown subset the app uses: headings, bullet and numbered
+    lists, paragraphs, bold, italics, code and links. Raw HTML passes through,
+    as it does with unsafe_allow_html=True.
+    """
+    out = []
+    paragraph = []
+    list_tag = None
+
+    def close_paragraph():
+        if paragraph:
+            out.append(f"<p>{inline_markdown(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    def set_list(tag):
+        nonlocal list_tag
+        if list_tag != tag:
+            if list_tag:
+                out.append(f"</{list_tag}>")
+            if tag:
+                out.append(f"<{tag}>")
+            list_tag = tag
+
+    for line in textwrap.dedent(text).strip().splitlines():
+        stripped = line.strip()
+        heading = _HEADING.match(stripped)
+        bullet = _BULLET.match(stripped)
+        numbered = _NUMBERED.match(stripped)
+        if not stripped:
+            close_paragraph()
+            set_list(None)
+        elif stripped.startswith("<"):
+            close_paragraph()
+            set_list(None)
+            out.append(line)
+        elif heading:
+            close_paragraph()
+            set_list(None)
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{inline_markdown(heading.group(2))}</h{level}>")
+        elif bullet or numbered:
+            close_paragraph()
+            set_list("ul" if bullet else "ol")
+            out.append(f"<li>{inline_markdown((bullet or numbered).group(1))}</li>")
+        else:
+            set_list(None)
+            paragraph.append(stripped)
+
+    close_paragraph()
+    set_list(None)
+    return "\n".join(out)
+
+
+class Exporter:
+    def __init__(self, out_dir, app_url):
+        self.out_dir = out_dir
+        self.app_url = app_url
+        self.charts = 0
+        self.skipped = {}
+        self.section = ""
+
+    def render(self, node):
+        """
+        HTML for one node of an AppTest element tree
+        """
+        children = getattr(node, "children", None)
+        if children is not None:
+            if node.type == "form":
+                return (f'<p class="live-app">This form needs the live app: '
+                        f'<a href="{html.escape(self.app_url)}">{html.escape(self.app_url)}</a></p>')
+            if node.type == "flex_container" and node.proto.id.split("-", 2)[-1].startswith(INTERACTIVE_KEY_PREFIX):
+                return ""  # views.common.interactive_block
+            children = list(children.values())
+            radio = next((i for i, child in enumerate(children) if getattr(child, "type", None) == "radio"), None)
+            if radio is not None:
+                # The section selector's container (see render_page)
+                self.section = "\n".join(filter(None, (self.render(child) for child in children[radio + 1:])))
+                children = children[:radio]
+                inner = "\n".join(filter(None, (self.render(child) for child in children)))
+                return f"{inner}\n{SECTION_MARKER}"
+            inner = "\n".join(filter(None, (self.render(child) for child in children)))
+            kind = node.type
+            if kind == "expander":
+                return f"<details><summary>{html.escape(node.label)}</summary>\n{inner}\n</details>"
+            if kind == "column":
+                return f'<div class="column">\n{inner}\n</div>'
+            if kind == "flex_container" and node.proto.flex_container.direction == node.proto.flex_container.HORIZONTAL:
+                return f'<div class="columns">\n{inner}\n</div>'
+            return inner
+
+        kind = node.type
+        if kind == "markdown":
+            value = node.value.strip()
+            if value.startswith(("<link", "<style>")):
+                # The app's CSS goes into the hashed stylesheet instead
+                return ""
+            return markdown_to_html(value)
+        if kind == "metric":
+            return (f'<div class="stat"><div class="stat-label">{html.escape(node.proto.label)}</div>'
+                    f'<div class="stat-value">{html.escape(node.proto.body)}</div></div>')
+        if kind == "plotly_chart":
+            self.charts += 1
+            chart_id = f"chart-{self.charts}"
+            # Plotly's JSON escapes "<", so the spec is safe inside a script tag
+            return (f'<div id="{chart_id}" class="chart"></div>\n<script>(function () {{\n'
+                    f'var figure = {node.proto.spec};\n'
+                    f'Plotly.newPlot("{chart_id}", figure.data, figure.layout, {{"responsive": true, "displaylogo": false}});\n'
+                    '})();</script>')
+        if kind == "caption":
+            return f'<p class="caption">{markdown_to_html(node.value)}</p>'
+        if kind in ("title", "header", "subheader"):
+            return f"<h2>{html.escape(node.value)}</h2>"
+        self.skipped[kind] = self.skipped.get(kind, 0) + 1
+        return ""
+
+    def render_page(self, at):
+        """
+        Render the current page; pages with a section radio get every section
+        """
+        if not at.radio:
+            return self.render(at.main)
+
+        labels = list(at.radio[0].options)
+        sections = []
+        page = None
+        for index, label in enumerate(labels):
+            at.radio[0].set_value(index).run()
+            # render() leaves SECTION_MARKER where the radio's container was
+            # and keeps what followed the radio in self.section
+            rendered = self.render(at.main)
+            page = page or rendered
+            sections.append(f'<section id="{section_slug(label)}">\n<h2>{html.escape(label)}</h2>\n'
+                            f'{self.section}\n</section>')
+
+        nav = " ".join(f'<a href="#{section_slug(label)}">{html.escape(label)}</a>' for label in labels)
+        return page.replace(SECTION_MARKER, f'<nav class="sections">{nav}</nav>\n' + "\n".join(sections))
+
+    def write_asset(self, name, data):
+        """
+        Write data under its hashed name in assets/; returns its site path
+
+        Names come from static_assets.hashed_name, as for the app's static files.
+        """
+        path = f"assets/{hashed_name(name, data)}"
+        with open(os.path.join(self.out_dir, path), "wb") as f:
+            f.write(data)
+        return path
+
+    def page_html(self, title, filename, body, css_path, plotly_path):
+        links = "\n".join(
+            f'<a href="{target}" class="{"active" if target == filename else ""}">{html.escape(page)}</a>'
+            for page, target in PAGES.items()
+        )
+        plotly = f'<script src="{plotly_path}"></script>\n' if plotly_path and "Plotly.newPlot" in body else ""
+        return (
+            "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+            "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n"
+            f"<title>{html.escape(title)} · Engineering Roadmap 2024-25</title>\n"
+            f'<link rel="stylesheet" href="{css_path}">\n{plotly}</head>\n<body>\n'
+            f'<nav class="pages">\n{links}\n<p class="caption"><a href="{html.escape(self.app_url)}">'
+            f"Open the live app</a></p>\n</nav>\n<main>\n{body}\n</main>\n</body>\n</html>\n"
+        )
+
+    def export(self):
+        if os.path.isdir(self.out_dir) and os.listdir(self.out_dir):
+            if not os.path.exists(os.path.join(self.out_dir, MARKER_FILE)):
+                raise RuntimeError(f"{self.out_dir} is not empty and was not written by this exporter")
+            shutil.rmtree(self.out_dir)
+        os.makedirs(os.path.join(self.out_dir, "assets"))
+        with open(os.path.join(self.out_dir, MARKER_FILE), "w", encoding="utf-8") as f:
+            f.write("Written by tools/export_static.py; replaced on the next export.\n")
+
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+        at.run()
+        paths = {spec.label: spec.path for spec in VIEWS}
+        bodies = {}
+        for page in PAGES:
+            at.switch_page(paths[page]).run()
+            if at.exception:
+                raise RuntimeError(f"{page} raised: {at.exception[0].message}")
+            bodies[page] = self.render_page(at)
+
+        app_css = "".join(read_asset(name) for name in STYLESHEETS)
+        css_path = self.write_asset("site.css", (app_css + SITE_CSS).encode("utf-8"))
+        plotly_path = None
+        if self.charts:
+            import plotly
+
+            with open(os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js"), "rb") as f:
+                plotly_path = self.write_asset("plotly.min.js", f.read())
+
+        for page, filename in PAGES.items():
+            with open(os.path.join(self.out_dir, filename), "w", encoding="utf-8") as f:
+                f.write(self.page_html(page, filename, bodies[page], css_path, plotly_path))
+        return list(PAGES.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", default=os.path.join(ROOT, "site"),
+                        help="output directory; replaced if an earlier export wrote it, else must be empty")
+    parser.add_argument("--app-url", default="http://localhost:8501",
+                        help="URL of the live app, linked for interactive features")
+    args = parser.parse_args()
+
+    exporter = Exporter(args.out, args.app_url)
+    files = exporter.export()
+    print(f"Wrote {len(files)} page(s) and {exporter.charts} chart(s) to {args.out}")
+    for kind, count in sorted(exporter.skipped.items()):
+        print(f"  skipped {count} {kind} element(s) with no static form")
+
+
+if __name__ == "__main__":
+    main()
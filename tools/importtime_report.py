@@ -0,0 +1,119 @@
+"""
+Import-time report for app.py pages.
+
+Each page is opened in a fresh interpreter started with `python -X importtime`.
+Streamlit and its test harness are imported first, so only imports triggered
+by the app itself are counted. The script fails when a page goes over its
+budget or pulls in a module that is meant to load only with Analytics.
+
+    python tools/importtime_report.py
+    python tools/importtime_report.py --budget-ms 150 --json importtime.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from views import PAGES as VIEWS  # noqa: E402
+
+PAGES = ["🏠 Home", "🖥️ CSE", "📞 Contact", "📊 Analytics"]
+
+# Modules only the Analytics page should load
+DEFERRED_MODULES = ["pandas", "plotly.express"]
+
+MARKER = "--- app imports start ---"
+
+PAGE_SCRIPT = """
+import sys
+import streamlit
+from streamlit.testing.v1 import AppTest
+sys.stderr.write({marker!r} + "\\n")
+at = AppTest.from_file("app.py", default_timeout=60).run()
+path = {path!r}
+if path != {home!r}:
+    at.switch_page(path).run()
+"""
+
+
+def measure_page(page):
+    """
+    Return {module: cumulative microseconds} for top-level imports made by the app
+    """
+    paths = {spec.label: spec.path for spec in VIEWS}
+    script = PAGE_SCRIPT.format(marker=MARKER, path=paths[page], home=VIEWS[0].path)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    lines = result.stderr.splitlines()
+    lines = lines[lines.index(MARKER) + 1:]
+
+    modules = {}
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        # Nested imports are indented; keep only the ones the app triggered directly
+        if name.startswith("  "):
+            modules[name.strip()] = modules.get(name.strip(), 0)
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=200.0,
+                        help="import budget for every page except Analytics")
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list per page")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    report = {}
+    failures = []
+    for page in PAGES:
+        modules = measure_page(page)
+        total_ms = sum(modules.values()) / 1000
+        loaded = [name for name in DEFERRED_MODULES if name in modules]
+        slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+
+        report[page] = {
+            "total_ms": round(total_ms, 1),
+            "deferred_loaded": loaded,
+            "slowest": {name: round(us / 1000, 1) for name, us in slowest if us},
+        }
+
+        print(f"{page}: {total_ms:.1f} ms of app imports")
+        for name, us in slowest:
+            if us:
+                print(f"    {us / 1000:8.1f} ms  {name}")
+
+        if page == "📊 Analytics":
+            continue
+        if total_ms > args.budget_ms:
+            failures.append(f"{page} imports took {total_ms:.1f} ms (budget {args.budget_ms} ms)")
+        if loaded:
+            failures.append(f"{page} loaded {', '.join(loaded)}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Concurrent-session load test for app.py.
+
+Starts the app with `streamlit run` on a local port and opens N websocket
+sessions that speak the same protocol as the browser. Each session opens
+pages from views.PAGES by URL path and waits a think time between them. Both
+come from a seeded random generator, so two runs with the same options send
+the same traffic. Reports rerun latency percentiles (send to script_finished),
+throughput, and server RSS growth per open session, measured after a warm-up
+visit to every page so one-off imports and caches are not counted.
+
+    python tools/loadtest.py --sessions 50 --navigations 20 --json load.json
+    python tools/loadtest.py --sessions 50 --baseline load.json --threshold 0.25
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import regression  # noqa: E402
+from views import PAGES  # noqa: E402
+
+# Metrics compared against the baseline; lower is better for all of them
+COMPARED = ["p50_ms", "p95_ms", "p99_ms", "rss_per_session_kib"]
+
+
+def start_server(port):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(ROOT, "app.py"),
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("streamlit server did not become healthy within 60s")
+
+
+def rss_kib(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+class Session:
+    def __init__(self, url):
+        self.url = url
+        self.websocket = None
+
+    async def __aenter__(self):
+        self.websocket = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.websocket.close()
+
+    async def rerun(self, page=PAGES[0]):
+        """
+        Rerun the script on page; returns (seconds, bytes received, error)
+        """
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        # The same field the browser sets when a page's URL is opened
+        message.rerun_script.page_name = page.url_path
+
+        started = time.perf_counter()
+        await self.websocket.send(message.SerializeToString())
+        received = 0
+        error = None
+        while True:
+            data = await self.websocket.recv()
+            received += len(data)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                if element.WhichOneof("type") == "exception":
+                    error = element.exception.message
+            elif kind == "script_finished":
+                if forward.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    error = error or ForwardMsg.ScriptFinishedStatus.Name(forward.script_finished)
+                return time.perf_counter() - started, received, error
+
+
+async def run_session(url, seed, index, navigations, think_mean, ramp, samples, done, release):
+    rng = random.Random(f"{seed}-{index}")
+    await asyncio.sleep(rng.uniform(0, ramp))
+    async with Session(url) as session:
+        seconds, received, error = await session.rerun()
+        samples.append(("(initial)", seconds, received, error))
+        for _ in range(navigations):
+            await asyncio.sleep(rng.expovariate(1 / think_mean) if think_mean else 0)
+            page = rng.choice(PAGES)
+            seconds, received, error = await session.rerun(page)
+            samples.append((page.label, seconds, received, error))
+
+        # Stay connected until every session is done, so RSS counts them all
+        done()
+        await release.wait()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def load(port, pid, sessions, navigations, think_mean, ramp, seed):
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+
+    # Warm up: visit every page once so imports and caches are loaded
+    async with Session(url) as session:
+        for page in PAGES:
+            await session.rerun(page)
+    await asyncio.sleep(1)
+    rss_before = rss_kib(pid)
+
+    samples = []
+    release = asyncio.Event()
+    remaining = [sessions]
+    all_done = asyncio.Event()
+
+    def done():
+        remaining[0] -= 1
+        if not remaining[0]:
+            all_done.set()
+
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(run_session(url, seed, i, navigations, think_mean, ramp, samples, done, release))
+             for i in range(sessions)]
+    peak = rss_before
+    while not all_done.is_set():
+        peak = max(peak, rss_kib(pid))
+        try:
+            await asyncio.wait_for(all_done.wait(), 0.5)
+        except asyncio.TimeoutError:
+            pass
+        failed = [task for task in tasks if task.done() and task.exception()]
+        if failed:
+            release.set()
+            raise failed[0].exception()
+    elapsed = time.perf_counter() - started
+    rss_after = rss_kib(pid)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    latencies = [seconds * 1000 for _, seconds, _, _ in samples]
+    by_page = {}
+    for page, seconds, _, _ in samples:
+        by_page.setdefault(page, []).append(seconds * 1000)
+
+    return {
+        "reruns": len(samples),
+        "errors": sum(1 for *_, error in samples if error),
+        "throughput_per_s": round(len(samples) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50), 1),
+        "p95_ms": round(percentile(latencies, 0.95), 1),
+        "p99_ms": round(percentile(latencies, 0.99), 1),
+        "max_ms": round(max(latencies), 1),
+        "kib_per_rerun": round(sum(received for _, _, received, _ in samples) / len(samples) / 1024, 1),
+        "rss_before_kib": rss_before,
+        "rss_peak_kib": peak,
+        "rss_per_session_kib": round((rss_after - rss_before) / sessions, 1),
+        "pages": {page: {"reruns": len(values), "p50_ms": round(statistics.median(values), 1),
+                         "p95_ms": round(percentile(values, 0.95), 1)}
+                  for page, values in sorted(by_page.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent sessions")
+    parser.add_argument("--navigations", type=int, default=20, help="page visits per session")
+    parser.add_argument("--think", type=float, default=2.0, help="mean think time between visits, in seconds")
+    parser.add_argument("--ramp", type=float, default=5.0, help="spread session starts over this many seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8599)
+    regression.add_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_server(args.port)
+    try:
+        results = asyncio.run(load(args.port, server.pid, args.sessions, args.navigations,
+                                   args.think, args.ramp, args.seed))
+    finally:
+        server.terminate()
+        server.wait()
+
+    options = {key: getattr(args, key) for key in ["sessions", "navigations", "think", "ramp", "seed"]}
+    print(f"{results['reruns']} reruns from {args.sessions} sessions, {results['errors']} error(s), "
+          f"{results['throughput_per_s']} reruns/s")
+    print(f"latency p50 {results['p50_ms']} ms, p95 {results['p95_ms']} ms, p99 {results['p99_ms']} ms, "
+          f"max {results['max_ms']} ms")
+    print(f"RSS {results['rss_before_kib']} KiB before, peak {results['rss_peak_kib']} KiB, "
+          f"{results['rss_per_session_kib']} KiB per session")
+    for page, stats in results["pages"].items():
+        print(f"  {page}: {stats['reruns']} reruns, p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms")
+
+    if args.json:
+        regression.save(args.json, {"options": options, "results": results})
+
+    if args.baseline:
+        regression.check(args.baseline,
+                         lambda baseline: regression.compare(results, baseline, COMPARED, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
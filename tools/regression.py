@@ -0,0 +1,49 @@
+"""
+Baseline comparison shared by bench_pages.py and loadtest.py.
+
+Both tools save their results with --json and can check a later run against
+such a file with --baseline. A metric that grew by more than --threshold
+counts as a regression and makes the tool exit with status 1.
+"""
+
+import json
+import sys
+
+
+def add_arguments(parser):
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative growth over the baseline (0.2 = 20%%)")
+
+
+def compare(results, baseline, keys, threshold):
+    """
+    Return a message for every metric in keys that grew by more than threshold
+
+    Lower is better for every metric compared.
+    """
+    regressions = []
+    for key in keys:
+        before, after = baseline[key], results[key]
+        if before and (after - before) / before > threshold:
+            regressions.append(f"{key} {before} -> {after}")
+    return regressions
+
+
+def save(path, report):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def check(path, find_regressions):
+    """
+    Print the regressions find_regressions reports for the baseline in path, then
+    exit with status 1 if there were any
+    """
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = find_regressions(baseline)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,112 @@
+"""
+Fault-injection check for the SQLite write-behind stores.
+
+Makes the first batches of ContactStore and ProgressStore fail, as a locked
+or full database would, and checks that the writer reports itself unhealthy,
+keeps running, and writes every queued row once the database recovers.
+Exits with status 1 if anything queued is lost.
+
+    python tools/writer_faults.py --failures 3
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from contact_store import ContactStore, query_inbox  # noqa: E402
+from progress_store import ProgressStore, connect  # noqa: E402
+
+
+def fail_first(writer, failures):
+    """
+    Make the next failures batches of writer raise before touching the database
+    """
+    write_batch = writer.write_batch
+    remaining = [failures]
+
+    def flaky(conn, batch):
+        if remaining[0]:
+            remaining[0] -= 1
+            raise sqlite3.OperationalError("database is locked (injected)")
+        write_batch(conn, batch)
+
+    writer.write_batch = flaky
+    writer.retry_delay = 0.05
+
+
+def wait_until(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def check_contact(directory, failures):
+    store = ContactStore(os.path.join(directory, "contact.db"), flush_interval=0.05)
+    fail_first(store._writer, failures)
+    for i in range(5):
+        store.submit(f"Student {i}", f"student{i}@example.com", "Feedback", f"Message {i}")
+
+    problems = []
+    if not wait_until(lambda: not store.healthy):
+        problems.append("contact: writer never reported the failure")
+    if not wait_until(lambda: store.healthy):
+        problems.append("contact: writer did not recover")
+    store.close()
+    stored = len(query_inbox(store.path))
+    if stored != 5:
+        problems.append(f"contact: {stored} of 5 messages stored")
+    return problems
+
+
+def check_progress(directory, failures):
+    store = ProgressStore(os.path.join(directory, "progress.db"), flush_interval=0.05)
+    fail_first(store._writer, failures)
+    store.set_done("21CS042", "CSE", ["1/Mathematics I", "1/Physics"])
+    store.set_done("21CS042", "CSE", ["1/Physics"], False)
+
+    problems = []
+    if not wait_until(lambda: not store.healthy):
+        problems.append("progress: writer never reported the failure")
+    if not wait_until(lambda: store.healthy and not store._pending):
+        problems.append("progress: queued writes were not retried")
+    store.close()
+
+    # Read the database directly, without the store's queued writes
+    conn = connect(store.path)
+    rows = conn.execute("SELECT track, item FROM progress WHERE student = '21CS042'").fetchall()
+    conn.close()
+    if rows != [("CSE", "1/Mathematics I")]:
+        problems.append(f"progress: stored {rows}, expected [('CSE', '1/Mathematics I')]")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--failures", type=int, default=3, help="batches to fail before writes succeed")
+    args = parser.parse_args()
+
+    # The writers log each failed batch with a traceback; the result is enough here
+    logging.getLogger("sqlite_writer").setLevel(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        problems = check_contact(directory, args.failures) + check_progress(directory, args.failures)
+
+    for problem in problems:
+        print(f"FAILED: {problem}")
+    if not problems:
+        print(f"OK: both stores retried {args.failures} failed batch(es) and lost nothing")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
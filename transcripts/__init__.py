@@ -0,0 +1,39 @@
+"""
+Lecture transcript pipeline used by Video__Text.ipynb.
+"""
+
+from transcripts.cache import TranscriptCache, cached_fetcher
+from transcripts.clean import ALL_RULES, DEFAULT_RULES, CleanRule, clean_stream, clean_text
+from transcripts.fetch import FetchResult, HostRateLimiter, extract_video_id, fetch_many, youtube_fetcher
+from transcripts.snippets import (
+    Snippet,
+    as_snippet,
+    parse_snippet_repr,
+    parse_transcript_repr,
+    snippets_from_fetched,
+)
+from transcripts.summarize import ChunkCache, PipelineModel, Summarizer, SummaryResult
+
+__all__ = [
+    "ALL_RULES",
+    "ChunkCache",
+    "CleanRule",
+    "DEFAULT_RULES",
+    "FetchResult",
+    "HostRateLimiter",
+    "PipelineModel",
+    "Snippet",
+    "Summarizer",
+    "SummaryResult",
+    "TranscriptCache",
+    "as_snippet",
+    "cached_fetcher",
+    "clean_stream",
+    "clean_text",
+    "extract_video_id",
+    "fetch_many",
+    "parse_snippet_repr",
+    "parse_transcript_repr",
+    "snippets_from_fetched",
+    "youtube_fetcher",
+]
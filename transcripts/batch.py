@@ -0,0 +1,191 @@
+"""
+Resumable batch job: fetch -> parse -> clean -> (optionally) summarize.
+
+Fetching runs on threads through fetch_many(). Cleaning and summarizing are
+CPU-bound and run in a process pool, each worker building its summarizer
+once. Every finished video is appended to a JSONL manifest as soon as it is
+done, and a restarted job skips the videos the manifest already lists as
+done, so a crash or Ctrl-C loses at most the videos that were in flight.
+Failed videos are recorded too and retried on the next run.
+
+Only a bounded number of videos is in flight at any time, so memory stays
+flat over tens of thousands of URLs:
+
+    python -m transcripts.batch urls.txt --workers 4 --summarize
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from transcripts.cache import TranscriptCache, cached_fetcher
+from transcripts.clean import ALL_RULES, DEFAULT_RULES, clean_stream
+from transcripts.fetch import extract_video_id, fetch_many, youtube_fetcher
+from transcripts.summarize import DEFAULT_MODEL
+
+DEFAULT_OUTPUT_DIR = "batch_output"
+
+# Video IDs become file names, so anything else is rejected
+_VIDEO_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+# Set in each worker process by _init_worker
+_rules = DEFAULT_RULES
+_summarizer = None
+
+
+def load_completed(manifest_path):
+    """
+    Video IDs the manifest lists as done
+    """
+    completed = set()
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a line cut short by a crash
+                if row.get("status") == "done":
+                    completed.add(row["video_id"])
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+def _init_worker(rules, model):
+    global _rules, _summarizer
+    _rules = rules
+    if model:
+        from transcripts.summarize import ChunkCache, Summarizer
+
+        _summarizer = Summarizer(model, cache=ChunkCache())
+
+
+def process_transcript(video_id, snippets, text_dir):
+    """
+    Clean (and summarize) one transcript in a worker process
+
+    The cleaned text is written to text_dir by the worker, so only the small
+    result travels back to the parent. Returns (chars, summary).
+    """
+    if not _VIDEO_ID.fullmatch(video_id):
+        raise ValueError(f"unexpected video ID {video_id!r}")
+    text = "".join(clean_stream(snippets, _rules))
+
+    path = os.path.join(text_dir, f"{video_id}.txt")
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(f"{path}.tmp", path)
+
+    summary = _summarizer.summarize(text).summary if _summarizer and text else None
+    return len(text), summary
+
+
+def run_batch(urls, output_dir=DEFAULT_OUTPUT_DIR, workers=None, fetch_workers=8, rate=2.0,
+              rules=DEFAULT_RULES, model=None, fetcher=youtube_fetcher, progress_every=100):
+    """
+    Process urls, skipping videos already done in output_dir/manifest.jsonl
+
+    Returns a dict counting "done", "failed" and "skipped" videos.
+    """
+    text_dir = os.path.join(output_dir, "text")
+    os.makedirs(text_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, "manifest.jsonl")
+    completed = load_completed(manifest_path)
+    counts = {"done": 0, "failed": 0, "skipped": 0}
+
+    def todo():
+        seen = set()
+        for url in urls:
+            video_id = extract_video_id(url)
+            if video_id in completed or video_id in seen:
+                counts["skipped"] += 1
+                continue
+            if video_id is not None:
+                seen.add(video_id)
+            yield url
+
+    workers = workers or os.cpu_count()
+    fetch = cached_fetcher(fetcher, TranscriptCache(evict_every=100))
+    started = time.perf_counter()
+
+    with open(manifest_path, "a", encoding="utf-8") as manifest, \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(rules, model)) as pool:
+        def record(row):
+            row["finished_at"] = time.time()
+            manifest.write(json.dumps(row, ensure_ascii=False) + "\n")
+            manifest.flush()
+            counts[row["status"]] += 1
+            finished = counts["done"] + counts["failed"]
+            if progress_every and finished % progress_every == 0:
+                per_minute = finished / (time.perf_counter() - started) * 60
+                print(f"{finished} processed ({counts['failed']} failed), {per_minute:.1f} videos/minute")
+
+        def collect(futures):
+            for future in futures:
+                result = in_flight.pop(future)
+                row = {"video_id": result.video_id, "url": result.url}
+                try:
+                    chars, summary = future.result()
+                except Exception as e:
+                    record({**row, "status": "failed", "error": f"{type(e).__name__}: {e}"})
+                else:
+                    record({**row, "status": "done", "snippets": len(result.snippets), "chars": chars,
+                            "summary": summary})
+
+        in_flight = {}
+        for result in fetch_many(todo(), fetcher=fetch, max_workers=fetch_workers, rate=rate):
+            if result.error:
+                record({"video_id": result.video_id, "url": result.url, "status": "failed",
+                        "error": result.error})
+                continue
+
+            in_flight[pool.submit(process_transcript, result.video_id, result.snippets, text_dir)] = result
+            # Backpressure: stop pulling fetch results while the pool is saturated
+            if len(in_flight) >= 2 * workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        collect(list(in_flight))
+
+    return counts
+
+
+def read_urls(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch, clean and summarize many lecture transcripts.")
+    parser.add_argument("urls", help="file with one YouTube URL per line")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--workers", type=int, default=None, help="processes for cleaning/summarizing")
+    parser.add_argument("--fetch-workers", type=int, default=8, help="threads for fetching")
+    parser.add_argument("--rate", type=float, default=2.0, help="requests per second per host")
+    parser.add_argument("--all-rules", action="store_true",
+                        help="also drop [Applause], filler words and HTML entities")
+    parser.add_argument("--summarize", nargs="?", const=DEFAULT_MODEL, default=None,
+                        metavar="MODEL", help="summarize with a transformers model")
+    args = parser.parse_args()
+
+    counts = run_batch(
+        read_urls(args.urls),
+        output_dir=args.output_dir,
+        workers=args.workers,
+        fetch_workers=args.fetch_workers,
+        rate=args.rate,
+        rules=ALL_RULES if args.all_rules else DEFAULT_RULES,
+        model=args.summarize,
+    )
+    print(f"Done: {counts['done']}, failed: {counts['failed']}, skipped: {counts['skipped']}")
+
+
+if __name__ == "__main__":
+    main()
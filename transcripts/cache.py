@@ -0,0 +1,131 @@
+"""
+Persistent transcript cache keyed by YouTube video ID.
+
+Each video is one small JSON file holding its raw snippets; callers clean
+them with whatever rules they use. Files are written to a temporary name and renamed
+into place, so concurrent workers sharing the directory never read a partial
+entry. The least recently used entries are evicted once the cache grows past
+max_entries or max_bytes, and entries older than ttl seconds are ignored.
+Eviction scans the directory, so bulk jobs can set evict_every to run it
+only every so many writes.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+from transcripts.snippets import Snippet, as_snippet
+
+DEFAULT_CACHE_DIR = os.environ.get("TRANSCRIPT_CACHE_DIR", ".transcript_cache")
+
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class TranscriptCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_entries=5000, max_bytes=512 * 1024 * 1024,
+                 ttl=None, evict_every=1):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.evict_every = evict_every
+        self._puts = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, video_id):
+        # Anything that isn't a plain ID is hashed so it can't escape the directory
+        name = video_id if _VIDEO_ID.match(video_id) else hashlib.sha256(video_id.encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def get(self, video_id):
+        """
+        Return {"video_id", "fetched_at", "snippets"} or None
+        """
+        path = self._path(video_id)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if self.ttl is not None and time.time() - entry["fetched_at"] > self.ttl:
+            return None
+
+        # The modification time doubles as the last-used time for LRU eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        entry["snippets"] = [Snippet(*snippet) for snippet in entry["snippets"]]
+        return entry
+
+    def put(self, video_id, snippets):
+        entry = {
+            "video_id": video_id,
+            "fetched_at": time.time(),
+            "snippets": [list(as_snippet(snippet)) for snippet in snippets],
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self._path(video_id))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self._puts += 1
+        if self._puts % self.evict_every == 0:
+            self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache is within its limits
+        """
+        entries = []
+        total_bytes = 0
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue  # removed by another worker
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+                total_bytes += stat.st_size
+
+        entries.sort()
+        count = len(entries)
+        for _, size, path in entries:
+            over_entries = self.max_entries is not None and count > self.max_entries
+            over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes
+            if not (over_entries or over_bytes):
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            count -= 1
+            total_bytes -= size
+
+
+def cached_fetcher(fetcher, cache):
+    """
+    Wrap a fetcher so repeat lookups are served from cache
+    """
+    def fetch(video_id):
+        entry = cache.get(video_id)
+        if entry is not None:
+            return entry["snippets"]
+
+        snippets = [as_snippet(snippet) for snippet in fetcher(video_id)]
+        cache.put(video_id, snippets)
+        return snippets
+
+    return fetch
@@ -0,0 +1,87 @@
+"""
+Single-pass, streaming transcript cleaner.
+
+All rules are compiled into one regular expression together with whitespace
+normalization, so each snippet is scanned once. clean_stream() takes
+snippets one at a time and yields cleaned text as it goes, which keeps memory
+flat on multi-hour lectures and lets later stages start before the fetch
+finishes.
+"""
+
+import functools
+import html
+import re
+from collections import namedtuple
+
+# pattern is a regex; replacement is a string or a function of the match.
+# Rules whose replacement is "" remove text; any run of them, with the
+# whitespace around it, collapses to one space (or nothing, mid-word), so
+# "a [Music] [Applause] b" becomes "a b" without a second whitespace pass.
+CleanRule = namedtuple("CleanRule", "name pattern replacement")
+
+MUSIC = CleanRule("music", r"\[Music\]", "")
+APPLAUSE = CleanRule("applause", r"\[Applause\]", "")
+LAUGHTER = CleanRule("laughter", r"\[Laughter\]", "")
+FILLER_WORDS = CleanRule("filler_words", r"(?i:\b(?:um+|uh+|erm|hmm+)\b,?)", "")
+
+
+def _unescape(match):
+    return html.unescape(match.group())
+
+
+# A named function rather than a lambda, so rules can be pickled to worker processes
+HTML_ENTITIES = CleanRule("html_entities", r"&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[a-zA-Z]+);", _unescape)
+
+# What the notebook's clean_transcript_text always did
+DEFAULT_RULES = (MUSIC,)
+
+# Everything above, for noisier auto-generated captions
+ALL_RULES = (MUSIC, APPLAUSE, LAUGHTER, FILLER_WORDS, HTML_ENTITIES)
+
+
+def _removed(match):
+    text = match.group()
+    return " " if text[0].isspace() or text[-1].isspace() else ""
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(rules):
+    removals = [rule.pattern for rule in rules if rule.replacement == ""]
+    parts = [(rule.pattern, rule.replacement) for rule in rules if rule.replacement != ""]
+    if removals:
+        parts.insert(0, (r"\s*(?:(?:{})\s*)+".format("|".join(removals)), _removed))
+    parts.append((r"\s+", " "))
+
+    # Named groups, so rule patterns are free to use their own groups
+    regex = re.compile("|".join(f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(parts)))
+    replacements = {f"r{i}": replacement for i, (_, replacement) in enumerate(parts)}
+
+    def replace(match):
+        replacement = replacements[match.lastgroup]
+        return replacement(match) if callable(replacement) else replacement
+
+    return regex, replace
+
+
+def clean_text(text, rules=DEFAULT_RULES):
+    """
+    Clean one string: apply rules, collapse whitespace and strip the ends
+    """
+    regex, replace = _compile(tuple(rules))
+    return regex.sub(replace, text).strip()
+
+
+def clean_stream(snippets, rules=DEFAULT_RULES):
+    """
+    Yield cleaned text piece by piece for snippets (objects with .text, or strings)
+
+    Joining the pieces gives the same result as clean_text on the full text.
+    """
+    regex, replace = _compile(tuple(rules))
+    started = False
+    for snippet in snippets:
+        text = regex.sub(replace, snippet if isinstance(snippet, str) else snippet.text).strip()
+        if not text:
+            continue
+        yield f" {text}" if started else text
+        started = True
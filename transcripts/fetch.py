@@ -0,0 +1,150 @@
+"""
+Concurrent transcript fetching for many lecture videos at once.
+
+fetch_many() runs a bounded thread pool, rate limits requests per host and
+retries transient failures with exponential backoff. Results are yielded as
+soon as each video finishes, in completion order.
+
+The fetcher is any callable taking a video ID and returning its snippets, so
+tests and benchmarks can pass a local stub instead of calling YouTube.
+"""
+
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import parse_qs, urlparse
+
+FetchResult = namedtuple("FetchResult", "url video_id snippets error attempts seconds")
+
+# Hosts that are served by the same backend share one rate limit
+HOST_ALIASES = {
+    "youtu.be": "www.youtube.com",
+    "youtube.com": "www.youtube.com",
+    "m.youtube.com": "www.youtube.com",
+}
+
+# youtube_transcript_api errors worth retrying; the others (transcripts
+# disabled, video unavailable, ...) fail the same way every time
+TRANSIENT_ERRORS = {"RequestBlocked", "IpBlocked", "YouTubeRequestFailed"}
+
+
+def extract_video_id(video_url):
+    """
+    Extract the video ID from a watch?v= or youtu.be URL, or None if invalid
+    """
+    parsed = urlparse(video_url.strip())
+    if parsed.netloc.endswith("youtu.be"):
+        video_id = parsed.path.lstrip("/").split("/")[0]
+    else:
+        video_id = parse_qs(parsed.query).get("v", [""])[0]
+    return video_id or None
+
+
+def url_host(video_url):
+    host = urlparse(video_url.strip()).netloc.lower()
+    return HOST_ALIASES.get(host, host)
+
+
+def is_transient(error):
+    return isinstance(error, (ConnectionError, TimeoutError)) or type(error).__name__ in TRANSIENT_ERRORS
+
+
+_local = threading.local()
+
+
+def youtube_fetcher(video_id):
+    """
+    Default fetcher: one YouTubeTranscriptApi client per worker thread
+    """
+    api = getattr(_local, "api", None)
+    if api is None:
+        from youtube_transcript_api import YouTubeTranscriptApi
+        api = _local.api = YouTubeTranscriptApi()
+    return api.fetch(video_id).snippets
+
+
+class HostRateLimiter:
+    """
+    Token bucket per host: rate requests per second with bursts up to burst
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, updated = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - updated) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait_for = (1 - tokens) / self.rate
+            time.sleep(wait_for)
+
+
+def fetch_one(url, fetcher, limiter, retries=3, backoff=1.0):
+    """
+    Fetch one URL, retrying transient errors; never raises
+    """
+    start = time.perf_counter()
+    video_id = extract_video_id(url)
+    if video_id is None:
+        return FetchResult(url, None, None, "Invalid YouTube URL", 0, 0.0)
+
+    host = url_host(url)
+    attempt = 0
+    while True:
+        attempt += 1
+        limiter.acquire(host)
+        try:
+            snippets = fetcher(video_id)
+            return FetchResult(url, video_id, snippets, None, attempt, time.perf_counter() - start)
+        except Exception as e:
+            if attempt > retries or not is_transient(e):
+                return FetchResult(url, video_id, None, f"{type(e).__name__}: {e}", attempt,
+                                   time.perf_counter() - start)
+            # Exponential backoff with full jitter so workers don't retry in lockstep
+            time.sleep(random.uniform(0, backoff * 2 ** (attempt - 1)))
+
+
+def fetch_many(urls, fetcher=youtube_fetcher, max_workers=8, rate=2.0, burst=4,
+               retries=3, backoff=1.0):
+    """
+    Fetch transcripts for urls concurrently and yield FetchResults as they finish
+
+    At most max_workers requests run at once and at most twice that many URLs
+    are queued, so very long playlists do not pile up in memory.
+    """
+    limiter = HostRateLimiter(rate, burst)
+    urls = iter(urls)
+    pending = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        def submit_next():
+            for url in urls:
+                pending.add(pool.submit(fetch_one, url, fetcher, limiter, retries, backoff))
+                return True
+            return False
+
+        while len(pending) < 2 * max_workers and submit_next():
+            pass
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    submit_next()
+                    yield future.result()
+        finally:
+            # The caller stopped early; don't start the queued URLs
+            for future in pending:
+                future.cancel()
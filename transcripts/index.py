@@ -0,0 +1,354 @@
+"""
+Inverted index from tokens to the places they are said in lecture videos.
+
+Each token maps to a posting list of (video, position) pairs, where position
+counts tokens from the start of the video, so phrase queries are an
+intersection of shifted posting lists. Positions map back to the start time
+of the snippet they fall in. Posting lists are kept varint and delta encoded
+both in memory and on disk, and appended to as videos are added, so adding
+a video never re-encodes the rest of the index and loading a saved index
+does not decode any list until a query needs it.
+
+Build an index from a columnar store and query it with:
+
+    python -m transcripts.index build transcripts.arrow transcripts.idx
+    python -m transcripts.index query transcripts.idx "gradient descent"
+
+Building into an existing index only adds the videos it does not have yet;
+pass --rebuild after transcripts in the store were replaced or removed.
+"""
+
+import argparse
+import bisect
+import os
+import re
+import threading
+from collections import namedtuple
+
+from transcripts.snippets import as_snippet
+
+DEFAULT_INDEX_PATH = os.environ.get("TRANSCRIPT_INDEX", "transcripts.idx")
+
+MAGIC = b"TIDX1\n"
+
+# Decoded posting lists kept in memory between queries
+DECODED_CACHE_SIZE = 64
+
+Hit = namedtuple("Hit", "video_id start")
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def _put_varint(buffer, value):
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _get_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _decode_postings(data):
+    """
+    Decode a posting list to a list of doc << 32 | position keys
+
+    Each entry is a doc delta, then the position: absolute for a new doc,
+    otherwise relative to the previous position.
+    """
+    # Varints are decoded inline; this loop is where queries spend their time
+    keys = []
+    append = keys.append
+    offset = 0
+    end = len(data)
+    key = 0
+    while offset < end:
+        value = data[offset]
+        offset += 1
+        if value >= 0x80:
+            value, offset = _get_varint(data, offset - 1)
+        if value:
+            key = ((key >> 32) + value) << 32
+        value = data[offset]
+        offset += 1
+        if value >= 0x80:
+            value, offset = _get_varint(data, offset - 1)
+        key += value
+        append(key)
+    return keys
+
+
+class TranscriptIndex:
+    def __init__(self):
+        self._video_ids = []      # doc number -> video ID
+        self._docs = {}           # video ID -> live doc number
+        self._starts = []         # doc number -> snippet start times in ms
+        self._offsets = []        # doc number -> token position of each snippet
+        self._postings = {}       # token -> bytearray
+        self._last = {}           # token -> (doc, position) last appended
+        self._deleted = set()
+        self._decoded = {}        # token -> decoded keys, for recently queried tokens
+        self._decoded_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, video_id):
+        return video_id in self._docs
+
+    def video_ids(self):
+        return list(self._docs)
+
+    def add(self, video_id, snippets):
+        """
+        Index one video's snippets, replacing any earlier version of it
+        """
+        if video_id in self._docs:
+            self._deleted.add(self._docs.pop(video_id))
+            self._decoded = {}
+
+        doc = len(self._video_ids)
+        self._video_ids.append(video_id)
+        self._docs[video_id] = doc
+
+        starts = []
+        offsets = []
+        position = 0
+        for snippet in sorted((as_snippet(snippet) for snippet in snippets), key=lambda s: s.start):
+            starts.append(int(round(snippet.start * 1000)))
+            offsets.append(position)
+            for token in tokenize(snippet.text):
+                self._append(token, doc, position)
+                position += 1
+        self._starts.append(starts)
+        self._offsets.append(offsets)
+
+    def _append(self, token, doc, position):
+        postings = self._postings.get(token)
+        if postings is None:
+            postings = self._postings[token] = bytearray()
+        last = self._last.get(token)
+        if last is None and postings:
+            last = divmod(_decode_postings(postings)[-1], 1 << 32)
+        if last is None or last[0] != doc:
+            _put_varint(postings, doc - (last[0] if last else 0))
+            _put_varint(postings, position)
+        else:
+            _put_varint(postings, 0)
+            _put_varint(postings, position - last[1])
+        self._last[token] = (doc, position)
+        self._decoded.pop(token, None)
+
+    def _hit(self, doc, position):
+        snippet = bisect.bisect_right(self._offsets[doc], position) - 1
+        return Hit(self._video_ids[doc], self._starts[doc][snippet] / 1000)
+
+    def _keys(self, token):
+        with self._decoded_lock:
+            keys = self._decoded.pop(token, None)
+        if keys is None:
+            keys = _decode_postings(self._postings[token])
+            if self._deleted:
+                keys = [key for key in keys if key >> 32 not in self._deleted]
+            keys = frozenset(keys)
+
+        # Most recently used last; common words stay decoded between queries.
+        # Searches may run from several app sessions at once, hence the lock.
+        with self._decoded_lock:
+            self._decoded[token] = keys
+            if len(self._decoded) > DECODED_CACHE_SIZE:
+                del self._decoded[next(iter(self._decoded))]
+        return keys
+
+    def search(self, query, limit=None):
+        """
+        Places where the words of query are said in order, as Hits sorted by
+        video and start time; a single word is a one-word phrase
+        """
+        tokens = tokenize(query)
+        if not tokens or any(token not in self._postings for token in tokens):
+            return []
+
+        # Intersect from the rarest token, shifting each list back to the
+        # position the phrase would start at
+        order = sorted(range(len(tokens)), key=lambda i: len(self._postings[tokens[i]]))
+        matches = None
+        for i in order:
+            keys = self._keys(tokens[i])
+            if matches is None:
+                matches = {key - i for key in keys} if i else keys
+            else:
+                matches = {key for key in matches if key + i in keys}
+            if not matches:
+                return []
+
+        hits = []
+        for key in sorted(matches):
+            hit = self._hit(key >> 32, key & 0xFFFFFFFF)
+            if not hits or hits[-1] != hit:
+                hits.append(hit)
+                if limit is not None and len(hits) >= limit:
+                    break
+        return hits
+
+    def compact(self):
+        """
+        Drop replaced videos and renumber the rest
+        """
+        if not self._deleted:
+            return
+        live = [doc for doc in range(len(self._video_ids)) if doc not in self._deleted]
+        renumber = {old: new for new, old in enumerate(live)}
+
+        postings = self._postings
+        self._video_ids = [self._video_ids[doc] for doc in live]
+        self._docs = {video_id: doc for doc, video_id in enumerate(self._video_ids)}
+        self._starts = [self._starts[doc] for doc in live]
+        self._offsets = [self._offsets[doc] for doc in live]
+        self._postings = {}
+        self._last = {}
+        self._deleted = set()
+        self._decoded = {}
+        for token, data in postings.items():
+            for key in _decode_postings(data):
+                if key >> 32 in renumber:
+                    self._append(token, renumber[key >> 32], key & 0xFFFFFFFF)
+
+    def save(self, path):
+        self.compact()
+        out = bytearray(MAGIC)
+        _put_varint(out, len(self._video_ids))
+        for video_id, starts, offsets in zip(self._video_ids, self._starts, self._offsets):
+            encoded = video_id.encode("utf-8")
+            _put_varint(out, len(encoded))
+            out += encoded
+            _put_varint(out, len(starts))
+            previous_start = previous_offset = 0
+            for start, offset in zip(starts, offsets):
+                _put_varint(out, start - previous_start)
+                _put_varint(out, offset - previous_offset)
+                previous_start, previous_offset = start, offset
+
+        _put_varint(out, len(self._postings))
+        for token in sorted(self._postings):
+            encoded = token.encode("utf-8")
+            data = self._postings[token]
+            _put_varint(out, len(encoded))
+            out += encoded
+            _put_varint(out, len(data))
+            out += data
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(out)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a transcript index")
+
+        index = cls()
+        offset = len(MAGIC)
+        count, offset = _get_varint(data, offset)
+        for doc in range(count):
+            length, offset = _get_varint(data, offset)
+            video_id = data[offset:offset + length].decode("utf-8")
+            offset += length
+            snippets, offset = _get_varint(data, offset)
+            starts = []
+            offsets = []
+            start = position = 0
+            for _ in range(snippets):
+                delta, offset = _get_varint(data, offset)
+                start += delta
+                delta, offset = _get_varint(data, offset)
+                position += delta
+                starts.append(start)
+                offsets.append(position)
+            index._video_ids.append(video_id)
+            index._docs[video_id] = doc
+            index._starts.append(starts)
+            index._offsets.append(offsets)
+
+        # Posting lists stay encoded; each is decoded only when queried
+        terms, offset = _get_varint(data, offset)
+        for _ in range(terms):
+            length, offset = _get_varint(data, offset)
+            token = data[offset:offset + length].decode("utf-8")
+            offset += length
+            length, offset = _get_varint(data, offset)
+            index._postings[token] = bytearray(data[offset:offset + length])
+            offset += length
+        return index
+
+
+def build_from_store(store_path, index_path, rebuild=False):
+    """
+    Index the store's videos that index_path does not have yet; returns (index, added)
+
+    Videos already in the index are not read again, and the file is left
+    untouched when nothing was added. rebuild indexes the whole store from
+    scratch instead, for stores whose transcripts were replaced or removed.
+    """
+    from transcripts.store import TranscriptStore
+
+    store = TranscriptStore(store_path)
+    fresh = rebuild or not os.path.exists(index_path)
+    index = TranscriptIndex() if fresh else TranscriptIndex.load(index_path)
+    added = 0
+    for video_id in store.video_ids():
+        if video_id not in index:
+            index.add(video_id, store.snippets(video_id))
+            added += 1
+    if added or fresh:
+        index.save(index_path)
+    store.close()
+    return index, added
+
+
+def format_timestamp(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query a transcript search index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="add the videos of a columnar store to an index")
+    build.add_argument("store_path")
+    build.add_argument("index_path", nargs="?", default=DEFAULT_INDEX_PATH)
+    build.add_argument("--rebuild", action="store_true",
+                       help="index the whole store from scratch instead of adding new videos only")
+    query = commands.add_parser("query", help="search an index for a word or phrase")
+    query.add_argument("index_path")
+    query.add_argument("query")
+    query.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        index, added = build_from_store(args.store_path, args.index_path, args.rebuild)
+        print(f"Added {added} video(s); {args.index_path} indexes {len(index)} video(s)")
+    else:
+        for hit in TranscriptIndex.load(args.index_path).search(args.query, args.limit):
+            print(f"{hit.video_id}  {format_timestamp(hit.start)}")
+
+
+if __name__ == "__main__":
+    main()
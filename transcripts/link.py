@@ -0,0 +1,89 @@
+"""
+Link lecture transcript segments to curriculum subjects and topics.
+
+Transcripts are cut into fixed-length time windows, and windows and topics
+are both turned into TF-IDF vectors over the curriculum's vocabulary. The
+topic matrix is built once; scoring any number of windows is then a single
+sparse matrix product, whose entries are cosine similarities because every
+row is L2-normalized.
+
+scikit-learn (and numpy/scipy with it) is only imported when a
+CurriculumLinker is built.
+"""
+
+from collections import namedtuple
+
+Segment = namedtuple("Segment", "video_id start end score")
+
+
+def transcript_windows(snippets, seconds=60.0):
+    """
+    Yield (start, end, text) for consecutive windows of about seconds each
+    """
+    start = end = None
+    texts = []
+    for snippet in snippets:
+        if texts and snippet.start - start >= seconds:
+            yield start, end, " ".join(texts)
+            texts = []
+        if not texts:
+            start = snippet.start
+        texts.append(snippet.text)
+        end = snippet.start + snippet.duration
+    if texts:
+        yield start, end, " ".join(texts)
+
+
+class CurriculumLinker:
+    def __init__(self, topics, ngram_range=(1, 2)):
+        """
+        topics maps a key (e.g. a subject name) to the text describing it
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self.keys = list(topics)
+        self.vectorizer = TfidfVectorizer(stop_words="english", ngram_range=ngram_range,
+                                          sublinear_tf=True)
+        # terms x topics, ready to be multiplied from the left
+        self.topic_matrix = self.vectorizer.fit_transform(topics.values()).T.tocsr()
+
+    def similarities(self, texts):
+        """
+        Sparse (len(texts) x topics) matrix of cosine similarities
+        """
+        return self.vectorizer.transform(texts) @ self.topic_matrix
+
+    def top_segments(self, windows, texts, per_topic=3, min_score=0.3):
+        """
+        The best windows for every topic: {key: [Segment]}, best first
+
+        windows holds (video_id, start, end) for each of texts.
+        """
+        import numpy as np
+
+        scores = self.similarities(texts).tocsc()
+        links = {}
+        for column, key in enumerate(self.keys):
+            first, last = scores.indptr[column], scores.indptr[column + 1]
+            rows = scores.indices[first:last]
+            values = scores.data[first:last]
+            best = np.argsort(-values, kind="stable")[:per_topic]
+            segments = [Segment(*windows[rows[i]], round(float(values[i]), 3))
+                        for i in best if values[i] >= min_score]
+            if segments:
+                links[key] = segments
+        return links
+
+    def link_store(self, store, seconds=60.0, per_topic=3, min_score=0.3):
+        """
+        Link every video in a TranscriptStore in one batched product
+        """
+        windows = []
+        texts = []
+        for video_id in store.video_ids():
+            for start, end, text in transcript_windows(store.snippets(video_id), seconds):
+                windows.append((video_id, start, end))
+                texts.append(text)
+        if not texts:
+            return {}
+        return self.top_segments(windows, texts, per_topic, min_score)
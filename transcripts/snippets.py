@@ -0,0 +1,73 @@
+"""
+The snippet record shared by every stage of the transcript pipeline, and
+parsers that build it from fetched transcripts or their repr() dumps.
+"""
+
+import ast
+import re
+from collections import namedtuple
+
+# Same fields as youtube_transcript_api's FetchedTranscriptSnippet
+Snippet = namedtuple("Snippet", "text start duration")
+
+
+def as_snippet(item):
+    """
+    Convert a FetchedTranscriptSnippet, dict or sequence to a Snippet
+    """
+    if isinstance(item, Snippet):
+        return item
+    if isinstance(item, dict):
+        return Snippet(item["text"], float(item["start"]), float(item["duration"]))
+    if isinstance(item, (list, tuple)):
+        text, start, duration = item
+        return Snippet(text, float(start), float(duration))
+    return Snippet(item.text, float(item.start), float(item.duration))
+
+
+def snippets_from_fetched(fetched):
+    """
+    Read the snippets of a FetchedTranscript (or any iterable of snippets)
+    """
+    items = getattr(fetched, "snippets", fetched)
+    try:
+        # Fast path for snippet objects, which is what the API returns
+        return [Snippet(item.text, item.start, item.duration) for item in items]
+    except AttributeError:
+        return [as_snippet(item) for item in items]
+
+
+# One snippet in a repr() dump. Python quotes a string with double quotes when
+# it contains a single quote, so both styles are matched, with escapes.
+_SNIPPET_REPR = re.compile(
+    r"""text=(?:'([^'\\]*(?:\\.[^'\\]*)*)'|"([^"\\]*(?:\\.[^"\\]*)*)"), """
+    r"start=([-+0-9.eE]+), duration=([-+0-9.eE]+)"
+)
+_VIDEO_ID_REPR = re.compile(r"video_id='([^']*)'")
+
+
+def _unquote(body, quote):
+    if "\\" not in body:
+        return body
+    return ast.literal_eval(quote + body + quote)
+
+
+def parse_snippet_repr(dump):
+    """
+    Parse every snippet from the repr() of a FetchedTranscript in one pass
+    """
+    snippets = []
+    for single, double, start, duration in _SNIPPET_REPR.findall(dump):
+        text = _unquote(double, '"') if double or not single else _unquote(single, "'")
+        snippets.append(Snippet(text, float(start), float(duration)))
+    return snippets
+
+
+def parse_transcript_repr(dump):
+    """
+    Return (video_id, snippets) from the repr() of a FetchedTranscript
+    """
+    # video_id follows the snippet list, so look for it from the end
+    tail = dump[dump.rfind("]") + 1:] if "]" in dump else dump
+    match = _VIDEO_ID_REPR.search(tail)
+    return (match.group(1) if match else None), parse_snippet_repr(dump)
@@ -0,0 +1,173 @@
+"""
+Columnar snippet storage in the Arrow IPC file format.
+
+Every snippet is one row of (video_id, text, start, duration), and every
+video is one record batch sorted by start. The file is opened through a
+memory map, so reading a column or a slice of rows only touches the pages it
+needs, instead of loading and regex-parsing a whole repr dump like the
+single-cell transcript_output.csv.
+
+Convert an existing CSV with:
+
+    python -m transcripts.store transcript_output.csv transcripts.arrow
+
+write_store() replaces the whole file; merge_store() adds videos to it.
+"""
+
+import argparse
+import csv
+import os
+
+import numpy as np
+import pyarrow as pa
+
+from transcripts.snippets import Snippet, as_snippet, parse_transcript_repr
+
+SCHEMA = pa.schema([
+    ("video_id", pa.string()),
+    ("text", pa.string()),
+    ("start", pa.float64()),
+    ("duration", pa.float64()),
+])
+
+
+def write_store(path, transcripts):
+    """
+    Write (video_id, snippets) pairs to path; returns the number of videos
+
+    transcripts can be a generator, only one video is held in memory at a time.
+    """
+    tmp_path = f"{path}.tmp"
+    videos = 0
+    with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, SCHEMA) as writer:
+        for video_id, snippets in transcripts:
+            snippets = sorted((as_snippet(snippet) for snippet in snippets), key=lambda s: s.start)
+            if not snippets:
+                continue
+            writer.write_batch(pa.record_batch([
+                pa.array([video_id] * len(snippets), pa.string()),
+                pa.array([snippet.text for snippet in snippets], pa.string()),
+                pa.array([snippet.start for snippet in snippets], pa.float64()),
+                pa.array([snippet.duration for snippet in snippets], pa.float64()),
+            ], schema=SCHEMA))
+            videos += 1
+    os.replace(tmp_path, path)
+    return videos
+
+
+def merge_store(path, transcripts):
+    """
+    Add (video_id, snippets) pairs to the store at path; returns the number
+    of videos in it afterwards
+
+    Videos already in the store are replaced by new versions, the others are
+    copied over one at a time. The new transcripts are held in memory.
+    """
+    new = dict(transcripts)
+    if not os.path.exists(path):
+        return write_store(path, new.items())
+
+    def merged():
+        store = TranscriptStore(path)
+        try:
+            for video_id in store.video_ids():
+                if video_id not in new:
+                    yield video_id, store.snippets(video_id)
+        finally:
+            # Unmap before write_store() replaces the file
+            store.close()
+        yield from new.items()
+
+    return write_store(path, merged())
+
+
+class TranscriptStore:
+    def __init__(self, path):
+        self.path = path
+        self._source = pa.memory_map(path, "r")
+        self._reader = pa.ipc.open_file(self._source)
+
+        # One record batch per video; its first row names the video
+        self._batches = {}
+        for i in range(self._reader.num_record_batches):
+            batch = self._reader.get_batch(i)
+            self._batches[batch.column("video_id")[0].as_py()] = i
+
+    def __len__(self):
+        return len(self._batches)
+
+    def close(self):
+        self._reader = None
+        self._source.close()
+
+    def __contains__(self, video_id):
+        return video_id in self._batches
+
+    def video_ids(self):
+        return list(self._batches)
+
+    def slice(self, video_id, start=None, end=None):
+        """
+        Rows of one video whose start time falls in [start, end), as a RecordBatch
+        """
+        batch = self._reader.get_batch(self._batches[video_id])
+        starts = batch.column("start").to_numpy()
+        first = 0 if start is None else int(np.searchsorted(starts, start, side="left"))
+        last = len(starts) if end is None else int(np.searchsorted(starts, end, side="left"))
+        return batch.slice(first, max(0, last - first))
+
+    def snippets(self, video_id, start=None, end=None):
+        batch = self.slice(video_id, start, end)
+        return [Snippet(*row) for row in zip(
+            batch.column("text").to_pylist(),
+            batch.column("start").to_pylist(),
+            batch.column("duration").to_pylist(),
+        )]
+
+    def duration(self, video_id):
+        """
+        End time of the last snippet of a video, in seconds
+        """
+        batch = self._reader.get_batch(self._batches[video_id])
+        return max(start + duration for start, duration in zip(
+            batch.column("start").to_numpy(), batch.column("duration").to_numpy()))
+
+    def table(self, columns=None):
+        """
+        The whole store as a zero-copy Table, optionally limited to some columns
+        """
+        table = self._reader.read_all()
+        return table.select(columns) if columns else table
+
+
+def read_csv_transcripts(csv_path):
+    """
+    Yield (video_id, snippets) from a CSV whose Transcript column holds repr dumps
+    """
+    csv.field_size_limit(2 ** 31 - 1)
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row_number, row in enumerate(csv.DictReader(f), start=1):
+            video_id, snippets = parse_transcript_repr(row["Transcript"])
+            yield video_id or f"row-{row_number}", snippets
+
+
+def convert_csv(csv_path, store_path, merge=False):
+    if merge:
+        return merge_store(store_path, read_csv_transcripts(csv_path))
+    return write_store(store_path, read_csv_transcripts(csv_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a transcript CSV to a columnar store.")
+    parser.add_argument("csv_path")
+    parser.add_argument("store_path")
+    parser.add_argument("--merge", action="store_true",
+                        help="add the CSV's videos to an existing store instead of replacing it")
+    args = parser.parse_args()
+
+    videos = convert_csv(args.csv_path, args.store_path, args.merge)
+    print(f"Wrote {videos} transcript(s) to {args.store_path}")
+
+
+if __name__ == "__main__":
+    main()
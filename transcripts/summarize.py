@@ -0,0 +1,209 @@
+"""
+Chunked, batched summarization of cleaned transcripts.
+
+Each transcript is split on sentence boundaries into chunks that fit the
+model's token budget. Chunks from every transcript in a call go through the
+model together in fixed-size batches, and each chunk summary is cached by a
+hash of the model and the chunk text, so re-running a playlist only
+summarizes what changed. When the joined chunk summaries of a long video are
+still over budget they are chunked and summarized again, level by level,
+until one chunk is left.
+
+The model is pluggable: anything that maps a list of texts to a list of
+summaries works, so tests can run offline with a tiny local model or a plain
+function. transformers is only imported when a PipelineModel is built.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections import namedtuple
+
+DEFAULT_MODEL = "sshleifer/distilbart-cnn-12-6"
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get("TRANSCRIPT_CACHE_DIR", ".transcript_cache"), "summaries")
+
+SummaryResult = namedtuple("SummaryResult", "summary chunks cached levels")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class PipelineModel:
+    """
+    A transformers summarization pipeline on CPU
+    """
+    def __init__(self, model=DEFAULT_MODEL, batch_size=8, max_tokens=None, max_length=142,
+                 min_length=30):
+        from transformers import pipeline
+
+        self.name = model
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.min_length = min_length
+        self._pipeline = pipeline("summarization", model=model, device=-1)
+        self.tokenizer = self._pipeline.tokenizer
+        # Leave room for special tokens
+        self.max_tokens = max_tokens or min(self.tokenizer.model_max_length, 1024) - 8
+
+    def count_tokens(self, texts):
+        return [len(ids) for ids in self.tokenizer(texts, add_special_tokens=False)["input_ids"]]
+
+    def __call__(self, texts):
+        outputs = self._pipeline(texts, batch_size=self.batch_size, truncation=True,
+                                 max_length=self.max_length, min_length=self.min_length)
+        return [output["summary_text"] for output in outputs]
+
+
+def count_words(texts):
+    return [len(text.split()) for text in texts]
+
+
+def split_chunks(text, max_tokens, count_tokens=count_words):
+    """
+    Split text into chunks of whole sentences of at most max_tokens each
+
+    A sentence longer than the budget is split on words.
+    """
+    sentences = [sentence for sentence in _SENTENCE_END.split(text) if sentence]
+    chunks = []
+    current = []
+    current_tokens = 0
+    for sentence, tokens in zip(sentences, count_tokens(sentences)):
+        if tokens > max_tokens:
+            words = sentence.split()
+            step = max(1, len(words) * max_tokens // tokens)
+            pieces = [" ".join(words[i:i + step]) for i in range(0, len(words), step)]
+            pieces = list(zip(pieces, count_tokens(pieces)))
+        else:
+            pieces = [(sentence, tokens)]
+
+        for piece, piece_tokens in pieces:
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                current = []
+                current_tokens = 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+class ChunkCache:
+    """
+    Chunk summaries on disk, one small file per content hash
+    """
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key, summary):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(summary, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class Summarizer:
+    def __init__(self, model=None, max_tokens=None, batch_size=None, cache=None, max_levels=4):
+        """
+        model is a model name or path for PipelineModel, or any callable that
+        maps a list of texts to a list of summaries
+        """
+        if model is None or isinstance(model, str):
+            model = PipelineModel(model or DEFAULT_MODEL)
+        self.model = model
+        self.name = getattr(model, "name", getattr(model, "__name__", repr(model)))
+        self.count_tokens = getattr(model, "count_tokens", count_words)
+        self.max_tokens = max_tokens or getattr(model, "max_tokens", 512)
+        self.batch_size = batch_size or getattr(model, "batch_size", 8)
+        self.cache = cache
+        self.max_levels = max_levels
+
+    def _key(self, chunk):
+        return hashlib.sha256(f"{self.name}\0{chunk}".encode("utf-8")).hexdigest()
+
+    def _summarize_chunks(self, chunks):
+        """
+        Summaries for chunks (a list), running only uncached ones through the
+        model, in batches; returns (summaries, which ones came from the cache)
+        """
+        summaries = {}
+        for chunk in chunks:
+            if chunk in summaries:
+                continue
+            cached = self.cache.get(self._key(chunk)) if self.cache is not None else None
+            if cached is not None:
+                summaries[chunk] = cached
+
+        hits = [chunk in summaries for chunk in chunks]
+        pending = [chunk for chunk in dict.fromkeys(chunks) if chunk not in summaries]
+        for i in range(0, len(pending), self.batch_size):
+            batch = pending[i:i + self.batch_size]
+            for chunk, summary in zip(batch, self.model(batch)):
+                summaries[chunk] = summary
+                if self.cache is not None:
+                    self.cache.put(self._key(chunk), summary)
+
+        return [summaries[chunk] for chunk in chunks], hits
+
+    def summarize_many(self, texts):
+        """
+        Summarize several cleaned transcripts, batching chunks across them
+
+        Returns one SummaryResult per text, in order.
+        """
+        current = list(texts)
+        chunk_counts = [0] * len(current)
+        cached_counts = [0] * len(current)
+        levels = [0] * len(current)
+        active = [i for i, text in enumerate(current) if text.strip()]
+
+        for _ in range(self.max_levels):
+            if not active:
+                break
+
+            # Every chunk at this level, from every transcript still being reduced
+            owners = []
+            chunks = []
+            for i in active:
+                for chunk in split_chunks(current[i], self.max_tokens, self.count_tokens):
+                    owners.append(i)
+                    chunks.append(chunk)
+
+            summaries, hits = self._summarize_chunks(chunks)
+            parts = {i: [] for i in active}
+            for i, summary, hit in zip(owners, summaries, hits):
+                parts[i].append(summary)
+                cached_counts[i] += hit
+
+            still_active = []
+            for i in active:
+                chunk_counts[i] += len(parts[i])
+                levels[i] += 1
+                current[i] = " ".join(parts[i])
+                if len(parts[i]) > 1:
+                    still_active.append(i)
+            active = still_active
+
+        return [SummaryResult(text, chunks, cached, level)
+                for text, chunks, cached, level in zip(current, chunk_counts, cached_counts, levels)]
+
+    def summarize(self, text):
+        return self.summarize_many([text])[0]
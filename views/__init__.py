@@ -0,0 +1,42 @@
+"""
+Pages of the app, one script each, run by st.navigation from app.py.
+
+A rerun executes the selected page's script only, and each script imports
+just what its page needs. Every page has its own URL (/cse, /analytics, ...)
+and tabbed pages keep the open section in ?tab=, so both can be linked to.
+"""
+
+import re
+from collections import namedtuple
+
+# Containers keyed with this prefix hold live-app-only UI (see
+# views.common.interactive_block); tools/export_static.py leaves them out
+INTERACTIVE_KEY_PREFIX = "interactive_"
+
+
+class PageSpec(namedtuple("PageSpec", "path title icon url_path")):
+    @property
+    def label(self):
+        return f"{self.icon} {self.title}"
+
+
+# In sidebar order; the first page is the default, served at /
+PAGES = [
+    PageSpec("views/home.py", "Home", "🏠", ""),
+    PageSpec("views/cse.py", "CSE", "🖥️", "cse"),
+    PageSpec("views/it.py", "IT", "💻", "it"),
+    PageSpec("views/ece.py", "ECE", "🔌", "ece"),
+    PageSpec("views/semester_roadmap.py", "Semester Roadmap", "📚", "semester-roadmap"),
+    PageSpec("views/gate_preparation.py", "GATE Preparation", "🎯", "gate-preparation"),
+    PageSpec("views/analytics_dashboard.py", "Analytics", "📊", "analytics"),
+    PageSpec("views/lecture_search.py", "Lecture Search", "🔎", "lecture-search"),
+    PageSpec("views/transcript_viewer.py", "Transcripts", "📜", "transcripts"),
+    PageSpec("views/contact.py", "Contact", "📞", "contact"),
+]
+
+
+def section_slug(label):
+    """
+    The ?tab= value of a section label
+    """
+    return re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
@@ -0,0 +1,224 @@
+import json
+import os
+
+import streamlit as st
+
+import metrics
+from curriculum import progress_items
+from progress_store import PROGRESS_DB
+from views.common import interactive_block, load_catalog, load_progress_store
+
+# pandas and Plotly are imported inside the Analytics functions so that only
+# the first Analytics visit pays for loading them, not every page and worker.
+
+# Built Plotly figures are cached as JSON specs, keyed by a hash of the input
+# data. The least recently used spec is evicted past this many entries.
+FIGURE_CACHE_SIZE = 32
+
+@metrics.count_cache("figures", st.cache_data(max_entries=FIGURE_CACHE_SIZE))
+def weightage_bar_spec(branches, stages):
+    # stages maps each stage name to its share per branch, in branch order
+    import pandas as pd
+    import plotly.express as px
+    
+    df = pd.DataFrame({'Branch': branches, **stages})
+    
+    fig = px.bar(df, x='Branch', y=list(stages),
+                 title="Course Weightage Distribution",
+                 barmode='group')
+    fig.update_layout(height=500, yaxis_title="Share of subject weight (%)")
+    return fig.to_json()
+
+@metrics.count_cache("figures", st.cache_data(max_entries=FIGURE_CACHE_SIZE))
+def distribution_pie_spec(distribution, title):
+    import plotly.express as px
+    
+    fig = px.pie(values=list(distribution.values()), names=list(distribution.keys()),
+                 title=title)
+    return fig.to_json()
+
+@metrics.count_cache("figures", st.cache_data(max_entries=FIGURE_CACHE_SIZE))
+def progression_line_spec(semesters, progressions):
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    for name, progression in progressions.items():
+        fig.add_trace(go.Scatter(x=semesters, y=progression, mode='lines+markers', name=name))
+    
+    fig.update_layout(title="Semester-wise Weightage Progression",
+                      xaxis_title="Semester",
+                      yaxis_title="Share of subject weight (%)",
+                      height=500)
+    return fig.to_json()
+
+def show_figure_spec(spec):
+    import plotly.graph_objects as go
+    
+    # The spec was validated when it was built, so skip validating it again
+    st.plotly_chart(go.Figure(json.loads(spec), _validate=False), width="stretch")
+
+@metrics.count_cache("curriculum_analytics", st.cache_data)
+def curriculum_analytics():
+    # Chart data derived from the catalog, so it always matches the branch pages
+    import analytics
+    
+    return analytics.curriculum_aggregates(load_catalog())
+
+def show_analytics():
+    st.markdown('<h2 class="sub-header">📊 Analytics Dashboard</h2>', unsafe_allow_html=True)
+    
+    if st.toggle("👥 Cohort mode", key="cohort_mode", help="Aggregate student records instead of the curriculum"):
+        show_cohort_analytics()
+        return
+    
+    data = curriculum_analytics()
+    
+    # Weightage comparison chart
+    st.markdown("### Weightage Comparison Across Branches")
+    
+    show_figure_spec(weightage_bar_spec(data["branches"], data["stages"]))
+    
+    # Pie chart for CSE
+    st.markdown("### CSE Course Distribution")
+    
+    show_figure_spec(distribution_pie_spec(data["distributions"]["CSE"], "CSE Course Weightage"))
+    
+    # Semester progression
+    st.markdown("### Semester Progression")
+    
+    show_figure_spec(progression_line_spec(data["semesters"], data["progressions"]))
+    
+    show_progress_analytics()
+
+@metrics.count_cache("progress_summary", st.cache_data(ttl=60))
+def progress_summary():
+    # Cohort completion per track; a minute old at most, so reruns and
+    # sessions share one aggregate query
+    items = progress_items(load_catalog())
+    return [
+        (track, students, completions, 100 * completions / (students * len(items[track])))
+        for track, students, completions in load_progress_store().track_summary()
+        if track in items
+    ]
+
+@metrics.count_cache("figures", st.cache_data(ttl=60))
+def progress_item_spec(track):
+    import plotly.graph_objects as go
+    
+    counts = load_progress_store().item_counts(track)
+    students = {row[0]: row[1] for row in progress_summary()}.get(track) or 1
+    items = progress_items(load_catalog())[track]
+    
+    fig = go.Figure(go.Bar(x=items, y=[100 * counts.get(item, 0) / students for item in items]))
+    fig.update_layout(title=f"{track}: Share of Students Who Completed Each Item",
+                      xaxis_title="Item", yaxis_title="Students (%)", yaxis_range=[0, 100], height=450)
+    return fig.to_json()
+
+def show_progress_analytics():
+    # Visiting Analytics alone should not create the database
+    summary = progress_summary() if os.path.exists(PROGRESS_DB) else []
+    if not summary:
+        with interactive_block("progress_hint"):
+            st.markdown("### Student Progress")
+            st.caption("No progress recorded yet. Enter a student ID in the sidebar to start tracking.")
+        return
+    
+    st.markdown("### Student Progress")
+    
+    for col, (track, students, _, percent) in zip(st.columns(len(summary)), summary):
+        with col:
+            st.metric(f"{track} ({students} students)", f"{percent:.0f}% complete")
+    
+    track = st.selectbox("Track", [row[0] for row in summary], key="progress_track")
+    show_figure_spec(progress_item_spec(track))
+
+def cohort_scores_spec(scores):
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    for code, group in scores.groupby("branch", observed=True):
+        # Interquartile band, then the median on top
+        fig.add_trace(go.Scatter(x=list(group["semester"]) + list(group["semester"])[::-1],
+                                 y=list(group["q3"]) + list(group["q1"])[::-1],
+                                 fill="toself", opacity=0.2, line_width=0, hoverinfo="skip",
+                                 showlegend=False, name=f"{code} IQR"))
+        fig.add_trace(go.Scatter(x=group["semester"], y=group["median"], mode="lines+markers", name=code))
+    
+    fig.update_layout(title="Median Score by Semester (band: 25th-75th percentile)",
+                      xaxis_title="Semester", yaxis_title="Score", height=450)
+    return fig.to_json()
+
+def cohort_histogram_spec(centers, counts):
+    import plotly.graph_objects as go
+    
+    fig = go.Figure([go.Bar(x=centers, y=branch_counts, name=code, opacity=0.6)
+                     for code, branch_counts in counts.items()])
+    fig.update_layout(title="Score Distribution", barmode="overlay", bargap=0,
+                      xaxis_title="Score", yaxis_title="Records", height=450)
+    return fig.to_json()
+
+def cohort_scatter_spec(points, total):
+    import plotly.graph_objects as go
+    
+    # WebGL traces keep pan and zoom smooth with tens of thousands of points
+    fig = go.Figure([go.Scattergl(x=group["study_hours"], y=group["score"], mode="markers", name=code,
+                                  marker=dict(size=3, opacity=0.4))
+                     for code, group in points.groupby("branch", observed=True)])
+    fig.update_layout(title=f"Study Hours vs Score ({len(points):,} of {total:,} records)",
+                      xaxis_title="Study hours per week", yaxis_title="Score", height=500)
+    return fig.to_json()
+
+@metrics.count_cache("cohort", st.cache_data(max_entries=4, show_spinner="Aggregating cohort..."))
+def cohort_views(data, students):
+    # data is an uploaded CSV, or None for a synthetic cohort of that many
+    # students. Only aggregates and a bounded sample leave this function.
+    import io
+    
+    import analytics
+    import pandas as pd
+    
+    if data is None:
+        df = analytics.sample_cohort(load_catalog(), students)
+    else:
+        df = analytics.validate_cohort(pd.read_csv(io.BytesIO(data)))
+    
+    return {
+        "records": len(df),
+        "summary": analytics.cohort_summary(df),
+        "scores": cohort_scores_spec(analytics.semester_scores(df)),
+        "histogram": cohort_histogram_spec(*analytics.score_histogram(df)),
+        "scatter": cohort_scatter_spec(analytics.downsample(df), len(df)),
+    }
+
+def show_cohort_analytics():
+    upload = st.file_uploader("Student records (CSV)", type="csv",
+                              help="Columns: student_id, branch, semester, subject, study_hours, score")
+    
+    if upload is None:
+        students = st.number_input("Synthetic cohort size (students)", min_value=100, max_value=20000,
+                                   value=3000, step=500)
+        st.caption("No file uploaded, showing a synthetic cohort.")
+        data = None
+    else:
+        students = None
+        data = upload.getvalue()
+    
+    try:
+        views = cohort_views(data, students)
+    except ValueError as e:
+        st.error(f"Could not read the student records: {e}")
+        return
+    
+    st.markdown(f"### Cohort Overview ({views['records']:,} records)")
+    st.dataframe(views["summary"], hide_index=True)
+    
+    st.markdown("### Scores by Semester")
+    show_figure_spec(views["scores"])
+    
+    st.markdown("### Score Distribution")
+    show_figure_spec(views["histogram"])
+    
+    st.markdown("### Study Hours vs Score")
+    show_figure_spec(views["scatter"])
+
+show_analytics()
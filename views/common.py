@@ -0,0 +1,165 @@
+# Helpers shared by the pages in views/: the curriculum catalog, section
+# tabs, subject tables, progress widgets and lecture links. Imported once
+# per process; the page scripts themselves run on every rerun.
+
+import html
+import importlib.util
+import os
+
+import streamlit as st
+
+import metrics
+from curriculum import build_catalog, topic_texts
+from progress_store import PROGRESS_DB, ProgressStore
+from views import INTERACTIVE_KEY_PREFIX, section_slug
+
+# Render only the selected section of tabbed pages. Set to False to build
+# every tab with st.tabs on each run instead.
+LAZY_SECTIONS = True
+
+def interactive_block(name):
+    # Container for UI that only makes sense in the live app
+    return st.container(key=f"{INTERACTIVE_KEY_PREFIX}{name}")
+
+@metrics.count_cache("catalog", st.cache_resource)
+def load_catalog():
+    # Built once per process and shared by every session
+    return build_catalog()
+
+def show_sections(key, sections, render):
+    labels = [section["tab"] for section in sections]
+    
+    if not LAZY_SECTIONS:
+        for tab, section in zip(st.tabs(labels), sections):
+            with tab:
+                render(section)
+        return
+    
+    show_active_section(key, labels, sections, render)
+
+def sync_tab_param(key, slugs):
+    st.query_params["tab"] = slugs[st.session_state[key]]
+
+@metrics.fragment("active_section")
+def show_active_section(key, labels, sections, render):
+    # Switching sections reruns this fragment only, not the whole script. The
+    # open section is kept in ?tab=, so a shared link opens it directly.
+    slugs = [section_slug(label) for label in labels]
+    if key not in st.session_state and st.query_params.get("tab") in slugs:
+        st.session_state[key] = slugs.index(st.query_params["tab"])
+    
+    index = st.radio(
+        "Section",
+        range(len(sections)),
+        format_func=labels.__getitem__,
+        horizontal=True,
+        key=key,
+        label_visibility="collapsed",
+        on_change=sync_tab_param,
+        args=(key, slugs)
+    )
+    render(sections[index])
+
+def show_subjects(subjects):
+    # One table element per semester instead of a progress bar and a caption
+    # per subject. Weights are percentages, so bars run from 0 to 100. Plain
+    # HTML keeps pandas and pyarrow (needed by st.dataframe) off this page.
+    rows = "".join(
+        f'<tr><td>{html.escape(subject)}</td>'
+        f'<td><progress max="100" value="{weight}"></progress> {weight}%</td></tr>'
+        for subject, weight in subjects.items()
+    )
+    st.markdown(f'<table class="subject-table">{rows}</table>', unsafe_allow_html=True)
+
+TRANSCRIPT_STORE = os.environ.get("TRANSCRIPT_STORE", "transcripts.arrow")
+
+@metrics.count_cache("linker", st.cache_resource)
+def load_linker():
+    # The topic matrix is built once per process; linking is then one sparse product
+    from transcripts.link import CurriculumLinker
+    
+    return CurriculumLinker(topic_texts(load_catalog()))
+
+@metrics.count_cache("lecture_links", st.cache_data(max_entries=4))
+def link_lectures(path, mtime):
+    # mtime is part of the key, so a rebuilt store is linked again
+    from transcripts.store import TranscriptStore
+    
+    return load_linker().link_store(TranscriptStore(path))
+
+def lecture_links():
+    # Lecture links are optional: they need a transcript store and scikit-learn
+    if not os.path.exists(TRANSCRIPT_STORE) or importlib.util.find_spec("sklearn") is None:
+        return {}
+    return link_lectures(TRANSCRIPT_STORE, os.path.getmtime(TRANSCRIPT_STORE))
+
+def show_lecture_links(names):
+    links = lecture_links()
+    found = [(name, links[name]) for name in names if name in links]
+    if not found:
+        return
+    
+    from transcripts.index import format_timestamp
+    
+    with st.expander("🎬 Matching lecture segments"):
+        st.markdown("\n".join(
+            f"- **{name}**: " + ", ".join(
+                f"[{segment.video_id} @ {format_timestamp(segment.start)}]"
+                f"(https://www.youtube.com/watch?v={segment.video_id}&t={int(segment.start)}s)"
+                for segment in segments
+            )
+            for name, segments in found
+        ))
+
+@metrics.count_cache("progress_store", st.cache_resource)
+def load_progress_store():
+    # One reader pool and writer thread per process, shared by every session
+    return ProgressStore(PROGRESS_DB)
+
+def current_student():
+    return st.session_state.get("student", "").strip()
+
+def save_progress(key, student, track, items):
+    # Widget callback: items maps each option to its progress item
+    selected = st.session_state[key]
+    if isinstance(selected, bool):
+        selected = list(items) if selected else []
+    store = load_progress_store()
+    store.set_done(student, track, [items[option] for option in selected], True)
+    store.set_done(student, track, [item for option, item in items.items() if option not in selected], False)
+
+def show_progress_widget(widget, label, track, items, key):
+    # items maps option -> progress item; widget is st.multiselect (one
+    # option per item) or st.checkbox (one item)
+    student = current_student()
+    if not student:
+        return
+    
+    key = f"progress_{student}_{track}_{key}"
+    if key not in st.session_state:
+        done = {item for _, item in load_progress_store().completed(student, track)}
+        selected = [option for option, item in items.items() if item in done]
+        st.session_state[key] = selected if widget is st.multiselect else bool(selected)
+    
+    args = (label, list(items)) if widget is st.multiselect else (label,)
+    widget(*args, key=key, on_change=save_progress, args=(key, student, track, items))
+    if not load_progress_store().healthy:
+        st.caption("⚠️ Progress can't be saved right now; changes are kept and retried.")
+
+def show_stage(stage, code):
+    st.markdown(f"### {stage['title']} ({stage['weightage']}% Weightage)")
+    
+    for col, (semester, subjects) in zip(st.columns(2), stage["semesters"].items()):
+        with col:
+            st.markdown(f"#### Semester {semester}")
+            show_subjects(subjects)
+            show_progress_widget(st.multiselect, "✅ Completed", code,
+                                 {subject: f"{semester}/{subject}" for subject in subjects}, semester)
+            show_lecture_links(subjects)
+
+def show_branch(code):
+    branch = load_catalog()["branches"][code]
+    st.markdown(f'<h2 class="sub-header">{branch["title"]}</h2>', unsafe_allow_html=True)
+    
+    # Semester tabs
+    show_sections(f"{code.lower()}_section", branch["stages"], lambda stage: show_stage(stage, code))
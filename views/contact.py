@@ -0,0 +1,81 @@
+import streamlit as st
+
+import metrics
+from contact_store import CONTACT_DB, ContactStore
+
+@metrics.count_cache("contact_store", st.cache_resource)
+def load_contact_store():
+    # One queue and writer thread per process, shared by every session
+    return ContactStore(CONTACT_DB)
+
+def show_contact():
+    st.markdown('<h2 class="sub-header">📞 Contact & Support</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Get in Touch")
+        st.markdown("""
+        - **Email**: support@engineeringroadmap.com
+        - **Phone**: +1-234-567-8900
+        - **Address**: Engineering Roadmap HQ, Tech City, TC 12345
+        """)
+        
+        st.markdown("### Office Hours")
+        st.markdown("""
+        - **Monday - Friday**: 9:00 AM - 6:00 PM
+        - **Saturday**: 10:00 AM - 4:00 PM
+        - **Sunday**: Closed
+        """)
+    
+    with col2:
+        st.markdown("### Contact Form")
+        
+        with st.form("contact_form"):
+            name = st.text_input("Name")
+            email = st.text_input("Email")
+            subject = st.selectbox("Subject", ["General Inquiry", "Technical Support", "Feedback", "Partnership"])
+            message = st.text_area("Message")
+            submit_button = st.form_submit_button("Send Message")
+            
+            if submit_button:
+                if not (name.strip() and email.strip() and message.strip()):
+                    st.error("Please fill in your name, email and message.")
+                else:
+                    # Queued for the background writer, so this never waits on disk
+                    store = load_contact_store()
+                    store.submit(name, email, subject, message)
+                    if store.healthy:
+                        st.success("Thank you for your message! We'll get back to you soon.")
+                    else:
+                        # The writer keeps retrying, but the message is not stored yet
+                        st.warning("We couldn't save your message just now. Please try again later "
+                                   "or email support@engineeringroadmap.com.")
+    
+    st.markdown("### FAQ")
+    
+    with st.expander("How to use this roadmap?"):
+        st.markdown("""
+        1. Choose your engineering branch from the sidebar
+        2. Explore the semester-wise course structure
+        3. Check the weightage and assessment criteria
+        4. Follow the GATE preparation plan if needed
+        5. Use the analytics dashboard for insights
+        """)
+    
+    with st.expander("What are the career prospects?"):
+        st.markdown("""
+        - **CSE**: Software Engineer, Data Scientist, System Architect
+        - **IT**: Full-stack Developer, DevOps Engineer, IT Consultant
+        - **ECE**: Electronics Engineer, Communication Engineer, Embedded Systems Developer
+        """)
+    
+    with st.expander("How to prepare for GATE?"):
+        st.markdown("""
+        1. Start with foundation subjects (Mathematics, Programming)
+        2. Focus on core subjects (OS, Networks, Databases)
+        3. Practice with mock tests and previous papers
+        4. Maintain a study schedule and track progress
+        """)
+
+show_contact()
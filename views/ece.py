@@ -0,0 +1,3 @@
+from views.common import show_branch
+
+show_branch("ECE")
@@ -0,0 +1,76 @@
+import html
+
+import streamlit as st
+
+import metrics
+from curriculum import syllabus_topics, topic_lines
+from views.common import interactive_block, load_catalog, show_lecture_links, show_progress_widget, show_sections
+
+def show_gate_block(block):
+    st.markdown(f"#### Week {block['weeks']}: {block['title']}")
+    if "weightage" in block:
+        st.markdown(f"**Weightage: {block['weightage']}% | Target Score: {block['target']}**")
+    st.markdown(topic_lines(block["topics"]))
+    show_progress_widget(st.checkbox, f"✅ Weeks {block['weeks']} done", "GATE",
+                         {block["weeks"]: block["weeks"]}, block["weeks"])
+    show_lecture_links([name for name, _ in syllabus_topics(block)])
+
+def show_phase(phase):
+    st.markdown(f"### {phase['title']}")
+    
+    # First two week blocks side by side, the last one full width
+    blocks = phase["blocks"]
+    for col, block in zip(st.columns(2), blocks[:2]):
+        with col:
+            show_gate_block(block)
+    
+    for block in blocks[2:]:
+        show_gate_block(block)
+
+@metrics.fragment("study_planner")
+def show_study_planner():
+    # Slider changes rerun this fragment only, and the solver is memoized, so
+    # re-planning takes milliseconds
+    from gate_planner import STRENGTH_LEVELS, build_plan, gate_subjects
+    
+    subjects = gate_subjects(load_catalog()["gate"])
+    
+    with interactive_block("study_planner"), st.expander("🧭 Plan my preparation"):
+        col1, col2 = st.columns(2)
+        with col1:
+            weeks = st.slider("Weeks until the exam", 8, 52, 48, key="plan_weeks")
+        with col2:
+            hours = st.slider("Study hours per week", 5, 60, 20, step=5, key="plan_hours")
+        
+        st.markdown("**Self-rated strength** (1 = new to it, 5 = confident)")
+        columns = st.columns(3)
+        strengths = []
+        for i, subject in enumerate(subjects):
+            with columns[i % 3]:
+                strengths.append(st.select_slider(subject.title, options=list(STRENGTH_LEVELS), value=3,
+                                                  key=f"plan_strength_{i}"))
+        
+        plan = build_plan(subjects, tuple(strengths), weeks, hours)
+        st.metric("Expected score", f"{plan.expected:.1f} / {plan.max_score}",
+                  help="Marks expected from the syllabus subjects, given the hours below")
+        
+        rows = "".join(
+            f"<tr><td>{block.weeks}</td><td>{html.escape(block.title)}</td><td>{block.hours} h</td>"
+            f"<td>{'-' if block.expected is None else f'{block.expected:.1f} / {block.weightage}'}</td></tr>"
+            for block in plan.blocks
+        )
+        st.markdown(
+            '<table class="subject-table"><tr><th>Weeks</th><th>Subject</th><th>Hours</th>'
+            f'<th>Expected marks</th></tr>{rows}</table>',
+            unsafe_allow_html=True
+        )
+
+def show_gate_preparation():
+    st.markdown('<h2 class="sub-header">🎯 GATE Preparation Roadmap</h2>', unsafe_allow_html=True)
+    
+    show_study_planner()
+    
+    # Phase-wise tabs
+    show_sections("gate_section", load_catalog()["gate"], show_phase)
+
+show_gate_preparation()
@@ -0,0 +1,70 @@
+import html
+
+import streamlit as st
+
+from static_assets import render_template
+
+# Filled into assets/templates/branch_card.html
+BRANCH_CARDS = [
+    ("🖥️ Computer Science Engineering (CSE)",
+     "Focus on software development, algorithms, and computer systems",
+     ["Data Structures & Algorithms", "Operating Systems", "Computer Networks", "Database Systems"]),
+    ("💻 Information Technology (IT)",
+     "Focus on web development, databases, and information systems",
+     ["Web Technologies", "Database Management", "Software Engineering", "Information Security"]),
+    ("🔌 Electronics & Communication (ECE)",
+     "Focus on electronics, communication systems, and signal processing",
+     ["Digital Electronics", "Communication Systems", "Signal Processing", "VLSI Design"]),
+]
+
+def show_home():
+    st.markdown('<h2 class="sub-header">Welcome to Engineering Roadmap 2024-25</h2>', unsafe_allow_html=True)
+    
+    for col, (title, summary, topics) in zip(st.columns(3), BRANCH_CARDS):
+        with col:
+            st.markdown(render_template(
+                "branch_card.html",
+                title=html.escape(title),
+                summary=html.escape(summary),
+                items="\n".join(f"        <li>{html.escape(topic)}</li>" for topic in topics),
+            ), unsafe_allow_html=True)
+    
+    # Key Features
+    st.markdown('<h3 class="sub-header">Key Features</h3>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        - **Complete Course Structure**: 8-semester detailed curriculum
+        - **Weightage Analysis**: Subject-wise importance and scoring
+        - **Semester Roadmap**: Year-wise learning progression
+        - **GATE Preparation**: 12-month systematic study plan
+        """)
+    
+    with col2:
+        st.markdown("""
+        - **Assessment Criteria**: Detailed grading system
+        - **Career Development**: Industry paths and opportunities
+        - **Learning Resources**: Books, platforms, and tools
+        - **Interactive Analytics**: Visual data representation
+        """)
+    
+    # Quick Stats
+    st.markdown('<h3 class="sub-header">Quick Statistics</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Semesters", "8", "Per Branch")
+    
+    with col2:
+        st.metric("Core Subjects", "15-20", "Per Branch")
+    
+    with col3:
+        st.metric("Elective Options", "8-12", "Per Branch")
+    
+    with col4:
+        st.metric("Project Work", "4-6", "Per Branch")
+
+show_home()
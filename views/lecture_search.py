@@ -0,0 +1,59 @@
+import os
+
+import streamlit as st
+
+import metrics
+
+TRANSCRIPT_INDEX = os.environ.get("TRANSCRIPT_INDEX", "transcripts.idx")
+SEARCH_LIMIT = 200
+
+@metrics.count_cache("search_index", st.cache_resource(max_entries=1))
+def load_transcript_index(path, mtime):
+    # Loaded once per process and shared; posting lists are decoded on first
+    # query. mtime is part of the key, so a rebuilt index is reloaded.
+    from transcripts.index import TranscriptIndex
+    
+    return TranscriptIndex.load(path)
+
+def show_search():
+    from transcripts.index import format_timestamp
+    
+    st.markdown('<h2 class="sub-header">🔎 Lecture Search</h2>', unsafe_allow_html=True)
+    
+    # A missing index is not cached, so building one shows up on the next rerun
+    if not os.path.exists(TRANSCRIPT_INDEX):
+        st.info(f"No transcript index found at `{TRANSCRIPT_INDEX}`. Build one with "
+                "`python -m transcripts.index build transcripts.arrow`.")
+        return
+    index = load_transcript_index(TRANSCRIPT_INDEX, os.path.getmtime(TRANSCRIPT_INDEX))
+    
+    query = st.text_input("Search lecture transcripts", placeholder="e.g. gradient descent")
+    
+    # The selected timestamp survives reruns, so the player stays open while browsing results
+    if "search_jump" in st.session_state:
+        video_id, start = st.session_state.search_jump
+        st.video(f"https://www.youtube.com/watch?v={video_id}", start_time=int(start))
+    
+    if not query.strip():
+        st.caption(f"{len(index)} lecture(s) indexed")
+        return
+    
+    hits = index.search(query, limit=SEARCH_LIMIT)
+    if not hits:
+        st.warning(f"No lecture mentions \"{query}\".")
+        return
+    
+    by_video = {}
+    for hit in hits:
+        by_video.setdefault(hit.video_id, []).append(hit.start)
+    st.caption(f"{len(hits)} match(es) in {len(by_video)} lecture(s)")
+    
+    for video_id, starts in by_video.items():
+        with st.expander(f"🎬 {video_id} ({len(starts)} match(es))"):
+            columns = st.columns(6)
+            for i, start in enumerate(starts):
+                if columns[i % 6].button(format_timestamp(start), key=f"jump_{video_id}_{start}"):
+                    st.session_state.search_jump = (video_id, start)
+                    st.rerun()
+
+show_search()
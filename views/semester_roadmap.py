@@ -0,0 +1,20 @@
+import streamlit as st
+
+from curriculum import topic_lines
+from views.common import load_catalog, show_sections
+
+def show_year(year):
+    st.markdown(f"### {year['title']}")
+    
+    for col, (semester, topics) in zip(st.columns(2), year["semesters"].items()):
+        with col:
+            st.markdown(f"#### Semester {semester}")
+            st.markdown(topic_lines(topics))
+
+def show_semester_roadmap():
+    st.markdown('<h2 class="sub-header">📚 Semester-wise Roadmap</h2>', unsafe_allow_html=True)
+    
+    # Year-wise tabs
+    show_sections("roadmap_section", load_catalog()["roadmap"], show_year)
+
+show_semester_roadmap()
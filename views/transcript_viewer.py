@@ -0,0 +1,72 @@
+import html
+import os
+
+import streamlit as st
+
+import metrics
+from views.common import TRANSCRIPT_STORE
+
+# Transcripts are shown a fixed time window at a time, so a page costs the
+# same however long the lecture is
+TRANSCRIPT_WINDOW_SECONDS = 300
+
+@metrics.count_cache("transcript_store", st.cache_resource(max_entries=1))
+def load_transcript_store(path, mtime):
+    # Memory-mapped; only the rows of the window being shown are read. Only
+    # the latest build is kept, so a rebuilt store releases the old mapping.
+    from transcripts.store import TranscriptStore
+    
+    return TranscriptStore(path)
+
+@metrics.count_cache("transcript_videos", st.cache_data(max_entries=8))
+def transcript_videos(path, mtime):
+    store = load_transcript_store(path, mtime)
+    return {video_id: store.duration(video_id) for video_id in store.video_ids()}
+
+@metrics.count_cache("transcript_pages", st.cache_data(max_entries=256))
+def transcript_page(path, mtime, video_id, start, end):
+    # Rendered HTML for one window; mtime is part of the key so a rebuilt store is reread
+    from transcripts.index import format_timestamp
+    
+    batch = load_transcript_store(path, mtime).slice(video_id, start, end)
+    return "".join(
+        f'<p><a href="https://www.youtube.com/watch?v={video_id}&t={int(snippet_start)}s">'
+        f'{format_timestamp(snippet_start)}</a> {html.escape(text)}</p>'
+        for text, snippet_start in zip(batch.column("text").to_pylist(), batch.column("start").to_pylist())
+    )
+
+def show_transcripts():
+    st.markdown('<h2 class="sub-header">📜 Lecture Transcripts</h2>', unsafe_allow_html=True)
+    
+    if not os.path.exists(TRANSCRIPT_STORE):
+        st.info(f"No transcript store found at `{TRANSCRIPT_STORE}`. Create one with "
+                "`python -m transcripts.store transcript_output.csv transcripts.arrow`.")
+        return
+    
+    mtime = os.path.getmtime(TRANSCRIPT_STORE)
+    videos = transcript_videos(TRANSCRIPT_STORE, mtime)
+    if not videos:
+        st.info("The transcript store is empty.")
+        return
+    
+    video_id = st.selectbox("Lecture", list(videos))
+    show_transcript_window(mtime, video_id, videos[video_id])
+
+@metrics.fragment("transcript_window")
+def show_transcript_window(mtime, video_id, duration):
+    # Paging reruns this fragment only
+    from transcripts.index import format_timestamp
+    
+    pages = max(1, -(-int(duration) // TRANSCRIPT_WINDOW_SECONDS))
+    page = st.number_input("Page", min_value=1, max_value=pages, value=1, key=f"transcript_page_{video_id}")
+    start = (page - 1) * TRANSCRIPT_WINDOW_SECONDS
+    end = start + TRANSCRIPT_WINDOW_SECONDS
+    
+    st.caption(f"{format_timestamp(start)} – {format_timestamp(min(end, duration))} "
+               f"of {format_timestamp(duration)} · page {page} of {pages}")
+    st.markdown(
+        f'<div class="transcript-window">{transcript_page(TRANSCRIPT_STORE, mtime, video_id, start, end)}</div>',
+        unsafe_allow_html=True
+    )
+
+show_transcripts()